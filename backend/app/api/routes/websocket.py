@@ -1,14 +1,16 @@
 import asyncio
+from base64 import b64decode as _b64decode
 import json
 import uuid
 import logging
 import time
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
 from typing import Dict, Optional
 from ...services.persona_service import PersonaService, get_persona_prompt
 from ...services.product_service import ProductService
 from ...services.livekit_service import LiveKitOrchestrationService
-from ...models.session import AgentStatus, WebSocketMessage, TranscriptMessage
+from ...models.session import AgentStatus, WebSocketMessage, TranscriptMessage, TranscriptEvent
 from ...core.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -18,11 +20,22 @@ router = APIRouter()
 active_sessions: Dict[str, Dict] = {}
 
 
+async def safe_send_bytes(websocket: WebSocket, data: bytes) -> bool:
+    """Safely send a binary frame through WebSocket with connection state check"""
+    try:
+        if websocket.client_state.name == "CONNECTED":
+            await websocket.send_bytes(data)
+            return True
+    except Exception as e:
+        logger.debug(f"Failed to send WebSocket binary frame: {e}")
+    return False
+
+
 async def safe_send_message(websocket: WebSocket, data: dict) -> bool:
     """Safely send a message through WebSocket with connection state check"""
     try:
         if websocket.client_state.name == "CONNECTED":
-            await websocket.send_text(json.dumps(data))
+            await websocket.send_text(orjson.dumps(data).decode())
             return True
     except Exception as e:
         logger.debug(f"Failed to send WebSocket message: {e}")
@@ -109,6 +122,11 @@ async def websocket_endpoint(websocket: WebSocket, persona_id: str):
             if is_connected:
                 await safe_send_message(websocket, data)
 
+        async def safe_send_audio(data):
+            """Send binary audio only if connection is still open"""
+            if is_connected:
+                await safe_send_bytes(websocket, data)
+
         # Callback functions for orchestration service
         async def on_status_change(status: AgentStatus):
             await safe_send({
@@ -124,8 +142,26 @@ async def websocket_endpoint(websocket: WebSocket, persona_id: str):
                     return
 
                 # Handle different types of messages
-                if isinstance(message, dict):
-                    if message.get("type") == "audio":
+                if isinstance(message, (bytes, bytearray, memoryview)):
+                    # Raw TTS audio; the preceding audio_header describes it
+                    await safe_send_audio(bytes(message))
+                elif isinstance(message, dict):
+                    if message.get("type") == "audio_header":
+                        await safe_send({
+                            "type": "audio_header",
+                            "data": {
+                                "length": message.get("length"),
+                                "mime_type": message.get("mime_type", "audio/mpeg"),
+                                "sample_rate": message.get("sample_rate"),
+                                "channels": message.get("channels"),
+                                "bit_rate": message.get("bit_rate"),
+                                "codec": message.get("codec"),
+                                "bit_depth": message.get("bit_depth"),
+                                "encoding": message.get("encoding"),
+                                "speaker": message.get("speaker"),
+                            }
+                        })
+                    elif message.get("type") == "audio":
                         # Audio response from TTS
                         await safe_send({
                             "type": "audio",
@@ -189,7 +225,7 @@ async def websocket_endpoint(websocket: WebSocket, persona_id: str):
                     return existing + incoming[k:]
             return existing + incoming
 
-        async def on_transcript_received(transcript_data):
+        async def on_transcript_received(transcript_data: TranscriptEvent):
             """Handle transcript updates from STT/TTS"""
             try:
                 session_data = active_sessions.get(session_id)
@@ -200,7 +236,7 @@ async def websocket_endpoint(websocket: WebSocket, persona_id: str):
                 logger.debug(f"[WebSocket] Received transcript data: {transcript_data}")
 
                 # Map speaker labels to allowed values
-                speaker_raw = transcript_data.get("speaker", "Unknown")
+                speaker_raw = transcript_data.speaker
                 if speaker_raw == "AI Assistant":
                     speaker = "Customer"
                 elif speaker_raw in ["Trainee", "Customer"]:
@@ -208,9 +244,9 @@ async def websocket_endpoint(websocket: WebSocket, persona_id: str):
                 else:
                     speaker = "Customer"  # Default fallback
 
-                is_final = transcript_data.get("is_final", True)
-                text = transcript_data.get("text", "")
-                confidence = transcript_data.get("confidence")
+                is_final = transcript_data.is_final
+                text = transcript_data.text
+                confidence = transcript_data.confidence
 
                 transcript_state = session_data.setdefault(
                     "transcript_state",
@@ -327,23 +363,39 @@ async def websocket_endpoint(websocket: WebSocket, persona_id: str):
                     logger.info("[WebSocket] Cancellation requested, breaking message loop")
                     break
 
-                data = await websocket.receive_text()
-                message_data = json.loads(data)
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
 
-                message_type = message_data.get("type")
+                # Binary frames carry raw PCM audio; text frames carry JSON control messages
+                audio_bytes = message.get("bytes")
+                if audio_bytes is not None:
+                    message_data = {}
+                    message_type = "audio"
+                else:
+                    message_data = orjson.loads(message.get("text") or "")
+                    message_type = message_data.get("type")
 
                 if message_type == "audio":
-                    # Handle audio input for STT processing
-                    audio_data = message_data.get("data", {}).get("audio", "")
-                    if not audio_data:
+                    if audio_bytes is None:
+                        # Legacy clients still send base64 audio inside JSON
+                        audio_base64 = message_data.get("data", {}).get("audio", "")
+                        if not audio_base64:
+                            continue
+                        try:
+                            audio_bytes = _b64decode(audio_base64)
+                        except Exception as e:
+                            logger.error(f"[WebSocket] Failed to decode base64 audio: {e}")
+                            continue
+                    if not audio_bytes:
                         continue
                     now = time.time()
                     # Verbose per-audio logs throttled to avoid flooding logs
                     if now - last_audio_log_time >= audio_log_interval:
-                        logger.info(f"[WebSocket] Received audio data: {len(audio_data)} base64 chars")
+                        logger.info(f"[WebSocket] Received audio data: {len(audio_bytes)} bytes")
                         last_audio_log_time = now
                     else:
-                        logger.debug(f"[WebSocket] Received audio (throttled): {len(audio_data)} base64 chars")
+                        logger.debug(f"[WebSocket] Received audio (throttled): {len(audio_bytes)} bytes")
                     # Check orchestration service
                     if not orchestration_service:
                         if now - last_stt_error_time >= stt_error_interval:
@@ -373,7 +425,7 @@ async def websocket_endpoint(websocket: WebSocket, persona_id: str):
                             else:
                                 logger.debug("[WebSocket] Sending audio frame to STT")
                             task = asyncio.create_task(
-                                orchestration_service.stt_service.send_audio_base64(audio_data)
+                                orchestration_service.stt_service.send_audio_bytes(audio_bytes)
                             )
                             background_tasks.add(task)
                             task.add_done_callback(background_tasks.discard)
@@ -25,6 +25,8 @@ class Settings(BaseSettings):
     # Deepgram Configuration (Speech-to-Text)
     deepgram_api_key: str
     deepgram_stream_params: str | None = None
+    # Share one multichannel Deepgram socket across up to N sessions (0 = one socket per session)
+    deepgram_multiplex_channels: int = 0
     
     # Groq Configuration (LLM)
     groq_api_key: str
@@ -40,6 +42,10 @@ class Settings(BaseSettings):
     # ElevenLabs Configuration (Text-to-Speech)
     elevenlabs_api_key: str
     elevenlabs_voice_id: str = "pNInz6obpgDQGcFmaJgB"  # Default voice ID (Adam)
+    elevenlabs_model: str = "eleven_turbo_v2"  # Lower-latency model family (eleven_monolingual_v1 for legacy quality)
+    elevenlabs_optimize_streaming_latency: int = 3  # 0 (best quality) .. 4 (lowest latency)
+    elevenlabs_max_concurrency: int = 8  # In-flight TTS requests across all sessions
+    elevenlabs_requests_per_minute: int = 120
 
     # Google Gemini Configuration (Multimodal AI)
     genai_api_key: str
@@ -47,12 +53,16 @@ class Settings(BaseSettings):
     # WebSocket Configuration
     ws_heartbeat_interval: int = 30
     ws_max_connections: int = 100
+    # Send TTS audio as binary frames (after a JSON audio_header) instead of base64 JSON
+    ws_binary_audio: bool = True
     
     # Audio Configuration
     audio_sample_rate: int = 16000
     audio_channels: int = 1
     audio_chunk_size: int = 1024
     user_pause_ms: int = 1200
+    # Outgoing STT batch size; frames are coalesced up to this much audio per send
+    stt_batch_ms: int = 100
 
     # Product Configuration
     product_name: str = "the 'Radiant Glow Skincare Set'"
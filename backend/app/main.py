@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 from logging.handlers import RotatingFileHandler
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -33,11 +35,27 @@ logger = logging.getLogger(__name__)
 # Get settings
 settings = get_settings()
 
+
+def check_event_loop():
+    # uvicorn[standard] runs on uvloop by default; warn if we fell back to the
+    # stock loop, since every streamed token pays per-callback loop overhead
+    loop_module = type(asyncio.get_running_loop()).__module__
+    if not loop_module.startswith("uvloop"):
+        logger.warning("Running on %s event loop; install uvloop for lower streaming overhead", loop_module)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    check_event_loop()
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.version,
-    debug=settings.debug
+    debug=settings.debug,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -72,5 +90,6 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        loop="auto"  # picks uvloop when installed (uvicorn[standard])
     )
\ No newline at end of file
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from pydantic import BaseModel
 from typing import Optional, Literal
 from enum import Enum
@@ -29,6 +30,15 @@ class TranscriptMessage(BaseModel):
     confidence: Optional[float] = None
 
 
+@dataclass(slots=True, frozen=True)
+class TranscriptEvent:
+    """Transcript update passed from the orchestrator to the websocket layer"""
+    text: str
+    is_final: bool
+    speaker: str
+    confidence: Optional[float] = None
+
+
 class AudioData(BaseModel):
     data: str  # base64 encoded audio
     mime_type: str
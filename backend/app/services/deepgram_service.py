@@ -1,19 +1,33 @@
 import asyncio
 import websockets
 import json
-import base64
+from base64 import b64decode as _b64decode
 import logging
-from typing import Optional, Callable
+import time
+from collections import deque
+from typing import Optional, Callable, Deque, Dict, Tuple, Union
+import numpy as np
+import orjson
 from ..models.session import AgentStatus
 
 logger = logging.getLogger(__name__)
 
+# Any bytes-like PCM buffer; websockets sends memoryviews without an extra copy
+AudioBuffer = Union[bytes, bytearray, memoryview]
+
 
 class DeepgramService:
     """Deepgram Speech-to-Text service using WebSocket API"""
 
-    def __init__(self, api_key: str, extra_query_params: Optional[str] = None):
+    # Receive-loop restart budget enforced by the supervisor
+    MAX_RECEIVE_RESTARTS = 5
+    RECEIVE_RESTART_WINDOW = 60.0
+    # Pending transcripts before queued interim results are shed
+    TRANSCRIPT_QUEUE_SIZE = 256
+
+    def __init__(self, api_key: str, extra_query_params: Optional[str] = None, channels: int = 1):
         self.api_key = api_key
+        self.channels = max(1, channels)
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
         self.is_running = False
         self.status = AgentStatus.IDLE
@@ -22,15 +36,21 @@ class DeepgramService:
         self._extra_query_params = extra_query_params.strip() if extra_query_params else None
 
         # Deepgram WebSocket URL for real-time transcription
-        # Use default model/params; tune as needed
+        # interim_results drive barge-in detection and smart_format supplies the
+        # punctuation the evaluator scores, so both stay on; no_delay stops
+        # smart_format from holding results back for extra formatting context.
         base_params = [
             "encoding=linear16",
             "sample_rate=16000",
-            "channels=1",
+            f"channels={self.channels}",
             "model=nova-2",
             "smart_format=true",
+            "no_delay=true",
             "interim_results=true",
         ]
+        if self.channels > 1:
+            # Transcribe each interleaved channel independently
+            base_params.append("multichannel=true")
 
         if self._extra_query_params:
             extra_fragment = self._extra_query_params.lstrip("?&")
@@ -40,7 +60,13 @@ class DeepgramService:
         self.ws_url = "wss://api.deepgram.com/v1/listen?" + "&".join(base_params)
 
         # Background tasks and state
-        self._receive_task: Optional[asyncio.Task] = None
+        self._supervisor_task: Optional[asyncio.Task] = None
+        # Strong references keep background tasks from being garbage-collected mid-run
+        self._tasks: set[asyncio.Task] = set()
+        # Parsed transcripts are handed to a consumer so slow callbacks never stall recv()
+        # Unbounded so finals always fit; _enqueue_transcript enforces TRANSCRIPT_QUEUE_SIZE
+        self._transcript_queue: asyncio.Queue = asyncio.Queue()
+        self._consumer_task: Optional[asyncio.Task] = None
         self._reconnect_task: Optional[asyncio.Task] = None
         self._last_activity = 0.0
         self._connection_lost = asyncio.Event()
@@ -183,35 +209,14 @@ class DeepgramService:
                 except Exception:
                     logger.debug(f"[STT] WebSocket object created: {type(self.ws)}")
 
-                # Verify connection with a ping and allow connection to stabilize
-                try:
-                    pong_waiter = await self.ws.ping()
-                    await asyncio.wait_for(pong_waiter, timeout=5.0)
-                    logger.info("[STT] Connection verified with successful ping")
-                    
-                    # Add a small delay to ensure connection is fully established
-                    await asyncio.sleep(0.5)
-                    # NOTE: Avoid sending an empty binary frame here. Some STT
-                    # servers (including Deepgram) treat an empty binary send as
-                    # an end-of-stream marker and will immediately finalize the
-                    # session (send Metadata then close). We rely on ping/pong
-                    # for transport verification and will not send any test
-                    # audio until actual audio frames arrive from the client.
-                    logger.debug("[STT] Connection stabilized; skipping empty test send to avoid signaling EOF")
-                except asyncio.TimeoutError:
-                    logger.error("[STT] Connection verification failed - no pong received")
-                    await self.ws.close()
-                    self.ws = None
-                    raise ConnectionError("Failed to verify WebSocket connection")
-                except Exception as e:
-                    logger.error(f"[STT] Connection verification failed: {e}")
-                    try:
-                        await self.ws.close()
-                    except Exception:
-                        pass
-                    self.ws = None
-                    raise
-                
+                # The WS handshake has completed; skip an extra ping/pong RTT and
+                # let the first audio send surface any failure (the retry loop
+                # reconnects). Long-term liveness is covered by ping_interval.
+                # NOTE: Avoid sending an empty binary frame here. Some STT
+                # servers (including Deepgram) treat an empty binary send as
+                # an end-of-stream marker and will immediately finalize the
+                # session (send Metadata then close).
+
             except websockets.exceptions.InvalidStatusCode as e:
                 logger.error(f"[STT] WebSocket connection failed with status {e.status_code}")
                 raise
@@ -219,38 +224,30 @@ class DeepgramService:
                 logger.error(f"[STT] WebSocket connection failed: {str(e)}")
                 raise
 
-            logger.info("[STT] WebSocket connection established and verified")
+            logger.info("[STT] WebSocket connection established")
 
             # Update status and create persistent connection handler
             self.is_running = True
             self.status = AgentStatus.LISTENING
 
-            # Start background receive task with error handling
-            if self._receive_task and not self._receive_task.done():
-                self._receive_task.cancel()
+            # Start the receive supervisor, replacing any previous one
+            if self._supervisor_task and not self._supervisor_task.done():
+                self._supervisor_task.cancel()
                 try:
-                    await self._receive_task
+                    await self._supervisor_task
                 except (asyncio.CancelledError, Exception):
                     pass
-                
-            self._receive_task = asyncio.create_task(self._receive_loop())
-            
-            def handle_task_completion(task):
-                try:
-                    # Check if the task failed
-                    exc = task.exception()
-                    if exc:
-                        logger.error(f"[STT] Receive task failed: {exc}")
-                        # Attempt to restart the receive task if still running
-                        if self.is_running and not self.ws.closed:
-                            logger.info("[STT] Restarting receive task...")
-                            self._receive_task = asyncio.create_task(self._receive_loop())
-                            self._receive_task.add_done_callback(handle_task_completion)
-                except (asyncio.CancelledError, Exception) as e:
-                    logger.error(f"[STT] Error in task completion handler: {e}")
-            
-            # Add completion callback to monitor task
-            self._receive_task.add_done_callback(handle_task_completion)
+
+            self._supervisor_task = self._spawn(
+                self._supervise_receive(),
+                name=f"deepgram-recv-{self.session_id or id(self)}",
+            )
+
+            if self._consumer_task is None or self._consumer_task.done():
+                self._consumer_task = self._spawn(
+                    self._consume_transcripts(),
+                    name=f"deepgram-dispatch-{self.session_id or id(self)}",
+                )
 
             logger.info("[STT] Deepgram session initialized successfully")
             return True
@@ -273,6 +270,44 @@ class DeepgramService:
             logger.error(f"[STT] Failed to initialize: {e}", exc_info=True)
             return False
 
+    def _spawn(self, coro, name: str) -> asyncio.Task:
+        """Create a named task anchored in self._tasks until it finishes"""
+        task = asyncio.get_running_loop().create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _supervise_receive(self):
+        """Run the receive loop, restarting it with backoff if it crashes.
+
+        Restarts are capped at MAX_RECEIVE_RESTARTS per RECEIVE_RESTART_WINDOW;
+        past that the session is marked not running so the next send reconnects.
+        """
+        restarts: Deque[float] = deque()
+        backoff = 0.5
+        while self.is_running and self.ws:
+            try:
+                await self._receive_loop()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[STT] Receive task failed: {e}")
+
+            now = time.monotonic()
+            while restarts and now - restarts[0] > self.RECEIVE_RESTART_WINDOW:
+                restarts.popleft()
+            if len(restarts) >= self.MAX_RECEIVE_RESTARTS:
+                logger.error("[STT] Receive loop restart limit reached; giving up until reconnect")
+                self.is_running = False
+                return
+            restarts.append(now)
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 10.0)
+            if self.is_running and not self._ws_is_closed():
+                logger.info("[STT] Restarting receive task...")
+
     async def _receive_loop(self):
         """Background task to receive transcripts from Deepgram"""
         while self.is_running and self.ws:
@@ -317,10 +352,49 @@ class DeepgramService:
 
         logger.info("[STT] Receive loop ended")
 
+    async def _consume_transcripts(self):
+        """Deliver queued transcripts to the callback outside the receive loop"""
+        while True:
+            payload = await self._transcript_queue.get()
+            try:
+                if self.on_transcript_callback:
+                    await self.on_transcript_callback(payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[STT] Error in transcript callback: {e}")
+            finally:
+                self._transcript_queue.task_done()
+
+    def _enqueue_transcript(self, payload: dict):
+        """Queue a transcript for dispatch, shedding queued interim results when full.
+
+        Finals are user turns and are never dropped; a queued interim result is
+        already superseded by whatever arrived after it.
+        """
+        if self._transcript_queue.qsize() >= self.TRANSCRIPT_QUEUE_SIZE:
+            dropped = self._filter_transcripts(lambda item: item.get("is_final"))
+            if dropped:
+                logger.warning("[STT] Transcript queue full; dropped %d interim transcripts", dropped)
+        self._transcript_queue.put_nowait(payload)
+
+    def _filter_transcripts(self, keep: Callable[[dict], bool]) -> int:
+        """Drop queued transcripts that keep() rejects, preserving order; returns the count"""
+        queue = self._transcript_queue
+        pending = []
+        while not queue.empty():
+            pending.append(queue.get_nowait())
+            queue.task_done()
+        for item in pending:
+            if keep(item):
+                queue.put_nowait(item)
+        return len(pending) - queue.qsize()
+
     async def _handle_message(self, message: str):
         """Handle incoming message from Deepgram"""
         try:
-            data = json.loads(message)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handler below still applies
+            data = orjson.loads(message)
 
             # Handle different message types
             if data.get("type") == "Results":
@@ -339,12 +413,18 @@ class DeepgramService:
                         else:
                             logger.debug(f"[STT] Interim transcript: '{transcript}' (confidence: {confidence})")
 
-                        await self.on_transcript_callback({
+                        payload = {
                             "text": transcript,
                             "is_final": is_final,
                             "confidence": confidence,
                             "speaker": "Trainee"
-                        })
+                        }
+                        # Multichannel results carry [channel, total_channels]
+                        channel_index = data.get("channel_index")
+                        if channel_index:
+                            payload["channel_index"] = channel_index[0]
+
+                        self._enqueue_transcript(payload)
 
             elif data.get("type") == "Metadata":
                 # Don't treat metadata message as a signal to close connection
@@ -370,12 +450,12 @@ class DeepgramService:
         except Exception as e:
             logger.error(f"[STT] Error handling message: {e}")
 
-    async def send_audio_base64(self, audio_base64: str, max_retries: int = 3) -> bool:
+    async def send_audio_bytes(self, audio_bytes: AudioBuffer, max_retries: int = 3) -> bool:
         """
-        Send base64-encoded audio data to Deepgram with automatic reconnection
+        Send raw audio bytes to Deepgram with automatic reconnection
 
         Args:
-            audio_base64: Base64-encoded audio data
+            audio_bytes: Raw linear16 PCM audio data (bytes or any bytes-like buffer)
             max_retries: Maximum number of reconnection attempts (default: 3)
         
         Returns:
@@ -415,8 +495,6 @@ class DeepgramService:
                         success = await self.initialize_session(self.on_transcript_callback)
                         if success:
                             logger.info("[STT] Reconnection successful")
-                            # Add extra delay after successful reconnection
-                            await asyncio.sleep(0.5)
                         else:
                             logger.error("[STT] Reconnection failed")
                             retry_count += 1
@@ -429,13 +507,6 @@ class DeepgramService:
                         await asyncio.sleep(min(1.0 * retry_count, 5.0))  # Exponential backoff
                         continue
 
-                # Decode base64 to bytes
-                try:
-                    audio_bytes = base64.b64decode(audio_base64)
-                except Exception as e:
-                    logger.error(f"[STT] Failed to decode base64 audio: {e}")
-                    return False
-
                 # Send binary audio data with connection state verification
                 try:
                     # Verify connection is still alive before sending
@@ -467,25 +538,19 @@ class DeepgramService:
         logger.error("[STT] Failed to send audio after all retries")
         return False
 
-    async def send_audio_bytes(self, audio_bytes: bytes):
+    async def send_audio_base64(self, audio_base64: str, max_retries: int = 3) -> bool:
         """
-        Send raw audio bytes to Deepgram
+        Deprecated: decode base64 audio and forward it to send_audio_bytes.
 
-        Args:
-            audio_bytes: Raw audio data as bytes
+        Clients should send binary frames instead; this shim remains for
+        callers that still transport audio as base64 text.
         """
-        if not self.is_connected():
-            logger.warning("[STT] Cannot send audio - not connected")
-            return
-
         try:
-            await self.ws.send(audio_bytes)
-            logger.debug(f"[STT] Sent {len(audio_bytes)} bytes of audio")
-            return True
-
+            audio_bytes = _b64decode(audio_base64)
         except Exception as e:
-            logger.error(f"[STT] Error sending audio: {e}")
+            logger.error(f"[STT] Failed to decode base64 audio: {e}")
             return False
+        return await self.send_audio_bytes(audio_bytes, max_retries=max_retries)
 
     async def close_session(self):
         """Close the Deepgram session"""
@@ -494,13 +559,24 @@ class DeepgramService:
         self.is_running = False
         self.status = AgentStatus.IDLE
 
-        # Cancel receive task
-        if self._receive_task and not self._receive_task.done():
-            self._receive_task.cancel()
+        # Cancel receive supervisor (and the receive loop it runs)
+        if self._supervisor_task and not self._supervisor_task.done():
+            self._supervisor_task.cancel()
+            try:
+                await asyncio.wait_for(self._supervisor_task, timeout=2.0)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+
+        # Stop transcript dispatch
+        if self._consumer_task and not self._consumer_task.done():
+            self._consumer_task.cancel()
             try:
-                await asyncio.wait_for(self._receive_task, timeout=2.0)
+                await asyncio.wait_for(self._consumer_task, timeout=2.0)
             except (asyncio.TimeoutError, asyncio.CancelledError):
                 pass
+        self._consumer_task = None
+        # Undelivered transcripts belong to this session, not the next one
+        self._filter_transcripts(lambda item: False)
 
         # Close WebSocket
         if self.ws:
@@ -520,4 +596,239 @@ class DeepgramService:
 
     async def close(self) -> None:
         """Compatibility wrapper that calls close_session"""
-        await self.close_session()
\ No newline at end of file
+        await self.close_session()
+
+
+class DeepgramChannel:
+    """Per-session handle onto one channel of a shared DeepgramMultiplexer connection.
+
+    Exposes the same surface as DeepgramService so the orchestration layer can use
+    either interchangeably.
+    """
+
+    def __init__(self, multiplexer: "DeepgramMultiplexer", session_id: str, channel_index: int):
+        self._multiplexer = multiplexer
+        self.session_id = session_id
+        self.channel_index = channel_index
+        self.on_transcript_callback: Optional[Callable] = None
+        self.is_running = False
+        self.status = AgentStatus.IDLE
+
+    def get_status(self) -> AgentStatus:
+        """Get current channel status"""
+        return self.status
+
+    def is_connected(self) -> bool:
+        """Check if this channel is active on a connected multiplexer"""
+        return self.is_running and self._multiplexer.is_connected()
+
+    async def initialize(self, on_transcript_callback: Optional[Callable] = None) -> bool:
+        """Attach to the shared connection, opening it if this is the first channel"""
+        self.on_transcript_callback = on_transcript_callback
+        if not await self._multiplexer.ensure_connected():
+            self.status = AgentStatus.ERROR
+            await self._multiplexer.release(self.session_id)
+            return False
+
+        self.is_running = True
+        self.status = AgentStatus.LISTENING
+        logger.info(f"[STT] Session {self.session_id} attached to Deepgram channel {self.channel_index}")
+        return True
+
+    async def send_audio_bytes(self, audio_bytes: AudioBuffer) -> bool:
+        """Queue mono PCM for this channel; the multiplexer interleaves and sends"""
+        if not self.is_running:
+            return False
+        return await self._multiplexer.write(self.channel_index, audio_bytes)
+
+    async def send_audio_base64(self, audio_base64: str) -> bool:
+        """Decode base64 audio and queue it for this channel"""
+        try:
+            audio_bytes = _b64decode(audio_base64)
+        except Exception as e:
+            logger.error(f"[STT] Failed to decode base64 audio: {e}")
+            return False
+        return await self.send_audio_bytes(audio_bytes)
+
+    async def close(self) -> None:
+        """Release this channel back to the multiplexer"""
+        self.is_running = False
+        self.status = AgentStatus.IDLE
+        await self._multiplexer.release(self.session_id)
+
+    async def close_session(self) -> None:
+        """Compatibility wrapper that calls close"""
+        await self.close()
+
+
+class DeepgramMultiplexer:
+    """Process-wide Deepgram connection shared by up to N trainee sessions.
+
+    Opens a single multichannel WebSocket and assigns each session its own channel.
+    Mono PCM written by each session is buffered per channel and interleaved into
+    multichannel frames (silence-padding idle channels); Results are routed back to
+    the owning session by `channel_index`.
+    """
+
+    # One shared connection per (api_key, channels, extra_query_params)
+    _instances: Dict[Tuple[str, int, Optional[str]], "DeepgramMultiplexer"] = {}
+    # 100ms of 16-bit mono PCM at 16kHz per channel
+    FRAME_BYTES = 3200
+    # How far (in frames) one channel may run ahead of a channel holding a partial
+    # frame before that partial is flushed padded; bounds the per-channel jitter
+    MAX_LEAD_FRAMES = 2
+    # Interleaved frames waiting for the sender (5s); the oldest is shed while
+    # the shared socket reconnects
+    OUTBOX_FRAMES = 50
+
+    def __init__(self, api_key: str, channels: int = 16, extra_query_params: Optional[str] = None):
+        self.channels = max(2, channels)
+        self._service = DeepgramService(api_key, extra_query_params=extra_query_params, channels=self.channels)
+        self._handles: Dict[str, DeepgramChannel] = {}
+        self._by_index: Dict[int, DeepgramChannel] = {}
+        self._buffers = [bytearray() for _ in range(self.channels)]
+        self._connect_lock = asyncio.Lock()
+        self._outbox: Deque[bytes] = deque(maxlen=self.OUTBOX_FRAMES)
+        self._sender_task: Optional[asyncio.Task] = None
+        self._send_ok = True
+
+    @classmethod
+    def get_instance(
+        cls,
+        api_key: str,
+        channels: int = 16,
+        extra_query_params: Optional[str] = None
+    ) -> "DeepgramMultiplexer":
+        """Return the multiplexer shared by this configuration, creating it on first use"""
+        key = (api_key, max(2, channels), extra_query_params)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(api_key, channels=channels, extra_query_params=extra_query_params)
+            cls._instances[key] = instance
+        return instance
+
+    def is_connected(self) -> bool:
+        """Check if the shared WebSocket is connected"""
+        return self._service.is_connected()
+
+    def get_channel(self, session_id: str) -> Optional[DeepgramChannel]:
+        """Assign (or return the existing) channel for a session; None when full"""
+        handle = self._handles.get(session_id)
+        if handle is not None:
+            return handle
+
+        free_index = next((i for i in range(self.channels) if i not in self._by_index), None)
+        if free_index is None:
+            logger.warning(f"[STT] All {self.channels} Deepgram channels in use; cannot assign session {session_id}")
+            return None
+
+        handle = DeepgramChannel(self, session_id, free_index)
+        self._handles[session_id] = handle
+        self._by_index[free_index] = handle
+        self._buffers[free_index].clear()
+        return handle
+
+    async def ensure_connected(self) -> bool:
+        """Open the shared connection if it is not already up"""
+        async with self._connect_lock:
+            if self._service.is_connected():
+                return True
+            return await self._service.initialize_session(self._dispatch_transcript)
+
+    async def write(self, channel_index: int, audio_bytes: AudioBuffer) -> bool:
+        """Buffer audio for a channel and queue full interleaved frames for sending.
+
+        Frames are built without awaiting, so their order is fixed here; a single
+        sender task ships them. A send that has to reconnect therefore only
+        delays the sender, never the sessions writing audio. Returns whether the
+        most recent send succeeded.
+        """
+        self._buffers[channel_index].extend(audio_bytes)
+        if len(self._buffers[channel_index]) < self.FRAME_BYTES:
+            return self._send_ok
+
+        while True:
+            ready, flush_partial = self._frame_state()
+            if not ready:
+                break
+            if len(self._outbox) == self.OUTBOX_FRAMES:
+                logger.warning("[STT] Deepgram multiplexer outbox full; dropping oldest frame")
+            self._outbox.append(self._interleave_frame(flush_partial))
+
+        if self._outbox and (self._sender_task is None or self._sender_task.done()):
+            self._sender_task = asyncio.create_task(self._send_outbox())
+        return self._send_ok
+
+    async def _send_outbox(self):
+        """Send queued frames in order until the outbox is empty"""
+        while self._outbox and self._handles:
+            frame = self._outbox.popleft()
+            self._send_ok = bool(await self._service.send_audio_bytes(frame))
+
+    def _frame_state(self) -> Tuple[bool, bool]:
+        """Whether a frame can go out, and whether partial buffers must be flushed.
+
+        A frame waits until every assigned channel that holds audio has a full
+        frame, so partial buffers are never padded mid-speech. Channels with no
+        audio are padded with silence. If a channel stalls on a partial frame,
+        the others are held back only until one runs MAX_LEAD_FRAMES ahead.
+        """
+        lead = 0
+        lagging = False
+        for index in self._by_index:
+            size = len(self._buffers[index])
+            if size >= self.FRAME_BYTES:
+                lead = max(lead, size)
+            elif size:
+                lagging = True
+        if not lead:
+            return False, False
+        if not lagging:
+            return True, False
+        flush_partial = lead >= self.FRAME_BYTES * self.MAX_LEAD_FRAMES
+        return flush_partial, flush_partial
+
+    def _interleave_frame(self, flush_partial: bool = False) -> bytes:
+        """Pop one frame from each full channel buffer and interleave the samples.
+
+        Partial buffers are kept for the next frame unless flush_partial is set.
+        """
+        samples = self.FRAME_BYTES // 2
+        frame = np.zeros((samples, self.channels), dtype=np.int16)
+        for index, buffer in enumerate(self._buffers):
+            if not buffer or (len(buffer) < self.FRAME_BYTES and not flush_partial):
+                continue
+            chunk = bytes(buffer[:self.FRAME_BYTES])
+            del buffer[:self.FRAME_BYTES]
+            usable = len(chunk) - (len(chunk) % 2)
+            frame[:usable // 2, index] = np.frombuffer(chunk[:usable], dtype=np.int16)
+        return frame.tobytes()
+
+    async def _dispatch_transcript(self, transcript_data: dict):
+        """Route a transcript to the session that owns its channel"""
+        handle = self._by_index.get(transcript_data.pop("channel_index", 0))
+        if handle and handle.is_running and handle.on_transcript_callback:
+            await handle.on_transcript_callback(transcript_data)
+
+    async def release(self, session_id: str) -> None:
+        """Free a session's channel; close the shared socket once idle"""
+        handle = self._handles.pop(session_id, None)
+        if handle is not None:
+            index = handle.channel_index
+            self._by_index.pop(index, None)
+            self._buffers[index].clear()
+            # The next session assigned this channel must not see its transcripts
+            self._service._filter_transcripts(lambda item: item.get("channel_index", 0) != index)
+
+        if not self._handles:
+            # Stop the sender first so a pending send cannot reconnect the socket
+            self._outbox.clear()
+            sender = self._sender_task
+            self._sender_task = None
+            if sender is not None and not sender.done():
+                sender.cancel()
+                await asyncio.gather(sender, return_exceptions=True)
+            async with self._connect_lock:
+                if not self._handles:
+                    await self._service.close_session()
+                    self._send_ok = True
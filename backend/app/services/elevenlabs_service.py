@@ -1,22 +1,75 @@
 import os
 import asyncio
 import logging
-import base64
-from typing import Optional, Callable, Dict, Any, List
+from base64 import b64encode as _b64encode
+import time
+from functools import lru_cache
+from typing import Optional, Callable, Dict, Any, AsyncIterator, FrozenSet, List, Tuple
+import httpx
+from aiolimiter import AsyncLimiter
 from elevenlabs import VoiceSettings, Voice
 from elevenlabs.client import AsyncElevenLabs
+from ..core.config import get_settings
 from ..models.session import AgentStatus
 
 logger = logging.getLogger(__name__)
 
 
+def _read_files(paths: List[str]) -> List[bytes]:
+    """Read each file fully (blocking; run in a worker thread)"""
+    contents = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            contents.append(f.read())
+    return contents
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> AsyncElevenLabs:
+    """Return a process-wide ElevenLabs client per API key so sessions share one connection pool"""
+    # Pool sized to the app-level concurrency cap so requests never queue inside httpx
+    max_connections = max(1, get_settings().elevenlabs_max_concurrency)
+    return AsyncElevenLabs(
+        api_key=api_key,
+        httpx_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=60.0,
+        ),
+    )
+
+
 class ElevenLabsService:
     """Service for handling Text-to-Speech using ElevenLabs"""
+
+    VOICE_CACHE_TTL = 300.0
+    # api_key -> (voice ids, expiry monotonic timestamp)
+    _voice_id_cache: Dict[str, Tuple[FrozenSet[str], float]] = {}
+    # Process-wide limits shared by every session's TTS requests (created on first use)
+    _tts_semaphore: Optional[asyncio.Semaphore] = None
+    _rate_limiter: Optional[AsyncLimiter] = None
     
-    def __init__(self, api_key: str, voice_id: str = "21m00Tcm4TlvDq8ikWAM"):
+    def __init__(
+        self,
+        api_key: str,
+        voice_id: str = "21m00Tcm4TlvDq8ikWAM",
+        model: Optional[str] = None,
+        optimize_streaming_latency: Optional[int] = None
+    ):
+        settings = get_settings()
         self.api_key = api_key
         self.voice_id = voice_id
-        self.client = AsyncElevenLabs(api_key=api_key)
+        self.model = model or settings.elevenlabs_model
+        # 0 (best quality) .. 4 (lowest latency); trades quality for time-to-first-byte
+        self.optimize_streaming_latency = (
+            settings.elevenlabs_optimize_streaming_latency
+            if optimize_streaming_latency is None
+            else optimize_streaming_latency
+        )
+        # Shared across services; never closed per session
+        self.client = _get_client(api_key)
         self.status = AgentStatus.IDLE
         self._on_audio_callback: Optional[Callable] = None
         self._on_error_callback: Optional[Callable] = None
@@ -43,14 +96,13 @@ class ElevenLabsService:
             self._on_audio_callback = on_audio_callback
             self._on_error_callback = on_error_callback
 
-            # Test the connection by getting available voices
-            available_voices = await self.get_available_voices()
-            if not available_voices:
+            # Test the connection via the (cached) voice catalog
+            voice_id_set = await self._get_voice_id_set(self.api_key)
+            if not voice_id_set:
                 raise Exception("Failed to connect to ElevenLabs API")
 
             # Verify the selected voice exists
-            voice_exists = any(voice.voice_id == self.voice_id for voice in available_voices)
-            if not voice_exists:
+            if self.voice_id not in voice_id_set:
                 logger.warning(f"Voice ID {self.voice_id} not found, using default")
                 self.voice_id = "21m00Tcm4TlvDq8ikWAM"  # Default Rachel voice
 
@@ -65,36 +117,76 @@ class ElevenLabsService:
                 await on_error_callback(f"ElevenLabs initialization failed: {str(e)}")
             return False
 
+    @classmethod
+    def _request_limits(cls) -> Tuple[asyncio.Semaphore, AsyncLimiter]:
+        """Return the shared concurrency semaphore and per-minute rate limiter"""
+        if cls._tts_semaphore is None or cls._rate_limiter is None:
+            settings = get_settings()
+            cls._tts_semaphore = asyncio.Semaphore(max(1, settings.elevenlabs_max_concurrency))
+            cls._rate_limiter = AsyncLimiter(max(1, settings.elevenlabs_requests_per_minute), 60)
+        return cls._tts_semaphore, cls._rate_limiter
+
+    async def text_to_speech_iter(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        model: Optional[str] = None,
+        voice_settings: Optional[VoiceSettings] = None,
+        optimize_streaming_latency: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield MP3 audio chunks as soon as ElevenLabs produces them"""
+        # Use provided voice_id or default
+        current_voice_id = voice_id or self.voice_id
+        current_voice_settings = voice_settings or self._voice_settings
+        current_model = model or self.model
+        current_latency = (
+            self.optimize_streaming_latency
+            if optimize_streaming_latency is None
+            else optimize_streaming_latency
+        )
+
+        # Hold a concurrency slot for the whole stream; the connection is busy until it ends
+        semaphore, rate_limiter = self._request_limits()
+        async with semaphore:
+            async with rate_limiter:
+                audio_generator = await self.client.generate(
+                    text=text,
+                    voice=Voice(voice_id=current_voice_id),
+                    voice_settings=current_voice_settings,
+                    model=current_model,
+                    optimize_streaming_latency=current_latency,
+                    stream=True
+                )
+
+            async for chunk in audio_generator:
+                if chunk:
+                    yield chunk
+
     async def text_to_speech(
         self,
         text: str,
         voice_id: Optional[str] = None,
-        model: str = "eleven_monolingual_v1",
-        voice_settings: Optional[VoiceSettings] = None
+        model: Optional[str] = None,
+        voice_settings: Optional[VoiceSettings] = None,
+        optimize_streaming_latency: Optional[int] = None
     ) -> Optional[bytes]:
-        """Convert text to speech and return audio bytes"""
+        """Convert text to speech and return the complete audio bytes.
+
+        Prefer text_to_speech_iter / stream_text_to_speech unless the whole blob is needed.
+        """
         if self.status == AgentStatus.ERROR:
             return None
 
         try:
             self.status = AgentStatus.SPEAKING
-            
-            # Use provided voice_id or default
-            current_voice_id = voice_id or self.voice_id
-            current_voice_settings = voice_settings or self._voice_settings
-
-            # Generate speech
-            audio_generator = await self.client.generate(
-                text=text,
-                voice=Voice(voice_id=current_voice_id),
-                voice_settings=current_voice_settings,
-                model=model
-            )
 
-            # Collect audio bytes
-            audio_bytes = b""
-            async for chunk in audio_generator:
-                audio_bytes += chunk
+            # Collect audio chunks and join once (linear, single copy)
+            chunks: List[bytes] = []
+            async for chunk in self.text_to_speech_iter(
+                text, voice_id, model, voice_settings, optimize_streaming_latency
+            ):
+                chunks.append(chunk)
+            audio_bytes = b"".join(chunks)
 
             # Trigger callback with audio data
             if self._on_audio_callback:
@@ -111,48 +203,78 @@ class ElevenLabsService:
                 await self._on_error_callback(f"TTS generation failed: {str(e)}")
             return None
 
+    async def text_to_speech_base64_iter(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        model: Optional[str] = None,
+        voice_settings: Optional[VoiceSettings] = None,
+        optimize_streaming_latency: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Yield base64 text for the TTS audio as chunks arrive.
+
+        Chunks are encoded on 3-byte boundaries so the concatenated output equals
+        base64 of the whole stream (padding only on the final piece).
+        """
+        remainder = b""
+        async for chunk in self.text_to_speech_iter(
+            text, voice_id, model, voice_settings, optimize_streaming_latency
+        ):
+            data = remainder + chunk if remainder else chunk
+            aligned = len(data) - len(data) % 3
+            remainder = data[aligned:]
+            if aligned:
+                yield _b64encode(data[:aligned]).decode('ascii')
+        if remainder:
+            yield _b64encode(remainder).decode('ascii')
+
     async def text_to_speech_base64(
         self,
         text: str,
         voice_id: Optional[str] = None,
-        model: str = "eleven_monolingual_v1",
-        voice_settings: Optional[VoiceSettings] = None
+        model: Optional[str] = None,
+        voice_settings: Optional[VoiceSettings] = None,
+        optimize_streaming_latency: Optional[int] = None
     ) -> Optional[str]:
-        """Convert text to speech and return base64 encoded audio"""
-        audio_bytes = await self.text_to_speech(text, voice_id, model, voice_settings)
-        if audio_bytes:
-            return base64.b64encode(audio_bytes).decode('utf-8')
-        return None
+        """Convert text to speech and return base64 encoded audio (encoded incrementally)"""
+        if self.status == AgentStatus.ERROR:
+            return None
+
+        try:
+            self.status = AgentStatus.SPEAKING
+            pieces = [
+                piece async for piece in self.text_to_speech_base64_iter(
+                    text, voice_id, model, voice_settings, optimize_streaming_latency
+                )
+            ]
+            self.status = AgentStatus.LISTENING
+            return "".join(pieces) or None
+
+        except Exception as e:
+            logger.error(f"Failed to generate TTS: {e}")
+            self.status = AgentStatus.ERROR
+            if self._on_error_callback:
+                await self._on_error_callback(f"TTS generation failed: {str(e)}")
+            return None
 
     async def stream_text_to_speech(
         self,
         text: str,
         voice_id: Optional[str] = None,
-        model: str = "eleven_monolingual_v1",
-        voice_settings: Optional[VoiceSettings] = None
+        model: Optional[str] = None,
+        voice_settings: Optional[VoiceSettings] = None,
+        optimize_streaming_latency: Optional[int] = None
     ) -> None:
-        """Stream text to speech with real-time audio chunks"""
+        """Stream text to speech, forwarding each chunk to the audio callback as it arrives"""
         if self.status == AgentStatus.ERROR:
             return
 
         try:
             self.status = AgentStatus.SPEAKING
-            
-            # Use provided voice_id or default
-            current_voice_id = voice_id or self.voice_id
-            current_voice_settings = voice_settings or self._voice_settings
-
-            # Stream audio generation
-            audio_generator = await self.client.generate(
-                text=text,
-                voice=Voice(voice_id=current_voice_id),
-                voice_settings=current_voice_settings,
-                model=model,
-                stream=True
-            )
 
-            # Stream audio chunks
-            async for chunk in audio_generator:
+            async for chunk in self.text_to_speech_iter(
+                text, voice_id, model, voice_settings, optimize_streaming_latency
+            ):
                 if self._on_audio_callback:
                     await self._on_audio_callback(chunk, "audio/mpeg", is_stream=True)
 
@@ -165,6 +287,33 @@ class ElevenLabsService:
             if self._on_error_callback:
                 await self._on_error_callback(f"TTS streaming failed: {str(e)}")
 
+    @classmethod
+    async def _get_voice_id_set(cls, api_key: str) -> FrozenSet[str]:
+        """Return the account's voice ids, refreshing the catalog at most every VOICE_CACHE_TTL seconds"""
+        cached = cls._voice_id_cache.get(api_key)
+        now = time.monotonic()
+        if cached and cached[1] > now:
+            return cached[0]
+
+        try:
+            voices_response = await _get_client(api_key).voices.get_all()
+        except Exception as e:
+            logger.error(f"Failed to get voices: {e}")
+            return frozenset()
+
+        voice_ids = frozenset(voice.voice_id for voice in voices_response.voices)
+        if voice_ids:
+            cls._voice_id_cache[api_key] = (voice_ids, now + cls.VOICE_CACHE_TTL)
+        return voice_ids
+
+    @classmethod
+    def invalidate_voice_cache(cls, api_key: Optional[str] = None):
+        """Drop cached voice catalogs (for one API key, or all)"""
+        if api_key is None:
+            cls._voice_id_cache.clear()
+        else:
+            cls._voice_id_cache.pop(api_key, None)
+
     async def get_available_voices(self) -> List[Voice]:
         """Get list of available voices"""
         try:
@@ -182,11 +331,8 @@ class ElevenLabsService:
     ) -> Optional[str]:
         """Clone a voice from audio files (returns voice_id if successful)"""
         try:
-            # Read audio files
-            file_data = []
-            for file_path in files:
-                with open(file_path, 'rb') as f:
-                    file_data.append(f.read())
+            # Read audio files off the event loop so other sessions keep streaming
+            file_data = await asyncio.to_thread(_read_files, files)
 
             # Clone voice
             voice = await self.client.clone(
@@ -195,6 +341,7 @@ class ElevenLabsService:
                 description=description or f"Cloned voice: {name}"
             )
 
+            self.invalidate_voice_cache(self.api_key)
             logger.info(f"Voice cloned successfully: {voice.voice_id}")
             return voice.voice_id
 
@@ -244,6 +391,7 @@ class ElevenLabsService:
         """Delete a cloned voice"""
         try:
             await self.client.voices.delete(voice_id)
+            self.invalidate_voice_cache(self.api_key)
             logger.info(f"Voice {voice_id} deleted successfully")
             return True
         except Exception as e:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from collections import Counter
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Iterable, List, Optional
 from uuid import uuid4
 
@@ -16,63 +18,80 @@ from ..models.evaluation import (
 from ..models.session import TranscriptMessage
 from ..services.product_service import ProductService
 
+try:
+	import ahocorasick
+except ImportError:  # Optional accelerator; the compiled regex alternation is the default
+	ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+_TOKEN_RE = re.compile(r"[A-Za-z']+")
+_SENTENCE_RE = re.compile(r"[.!?]+")
+_SENTENCE_END = (".", "!", "?")
+
+_FILLER_WORDS = frozenset({"um", "uh", "like", "you know", "sort of", "kinda"})
+_POSITIVE_WORDS = frozenset({
+	"great",
+	"awesome",
+	"happy",
+	"glad",
+	"absolutely",
+	"certainly",
+	"definitely",
+	"appreciate",
+	"thank",
+	"understand",
+	"pleasure",
+})
+_NEGATIVE_WORDS = frozenset({"can't", "cannot", "won't", "unfortunately", "hate", "terrible"})
+_EMPATHY_PHRASES = frozenset({
+	"i understand",
+	"i totally get",
+	"sorry to hear",
+	"i hear you",
+	"that makes sense",
+	"i appreciate",
+})
+_OBJECTION_PHRASES = frozenset({
+	"what concerns",
+	"how does that sound",
+	"does that address",
+	"let's explore",
+	"help you with",
+	"could you share",
+})
+_VALUE_PHRASES = frozenset({
+	"benefit",
+	"value",
+	"impact",
+	"results",
+	"improve",
+	"increase",
+	"reduce",
+})
+_CLOSING_PHRASES = frozenset({
+	"get started",
+	"place the order",
+	"sign up",
+	"set you up",
+	"next step",
+	"schedule a follow",
+	"move forward",
+	"ready to",
+	"would you like to",
+})
+_DEFAULT_PRODUCT_KEYWORDS = frozenset({"feature", "benefit", "ingredient", "price", "package", "guarantee"})
+_PHRASE_GROUPS = {
+	"empathy": _EMPATHY_PHRASES,
+	"objection": _OBJECTION_PHRASES,
+	"value": _VALUE_PHRASES,
+	"closing": _CLOSING_PHRASES,
+}
+
 
 class EvaluationService:
 	"""Rule-based evaluation pipeline that scores a finished conversation."""
 
-	FILLER_WORDS = {"um", "uh", "like", "you know", "sort of", "kinda"}
-	POSITIVE_WORDS = {
-		"great",
-		"awesome",
-		"happy",
-		"glad",
-		"absolutely",
-		"certainly",
-		"definitely",
-		"appreciate",
-		"thank",
-		"understand",
-		"pleasure",
-	}
-	NEGATIVE_WORDS = {"can't", "cannot", "won't", "unfortunately", "hate", "terrible"}
-	EMPATHY_PHRASES = {
-		"i understand",
-		"i totally get",
-		"sorry to hear",
-		"i hear you",
-		"that makes sense",
-		"i appreciate",
-	}
-	OBJECTION_PHRASES = {
-		"what concerns",
-		"how does that sound",
-		"does that address",
-		"let's explore",
-		"help you with",
-		"could you share",
-	}
-	VALUE_PHRASES = {
-		"benefit",
-		"value",
-		"impact",
-		"results",
-		"improve",
-		"increase",
-		"reduce",
-	}
-	CLOSING_PHRASES = {
-		"get started",
-		"place the order",
-		"sign up",
-		"set you up",
-		"next step",
-		"schedule a follow",
-		"move forward",
-		"ready to",
-		"would you like to",
-	}
 	CATEGORY_SEQUENCE = [
 		EvaluationCategoryName.GRAMMAR_CLARITY,
 		EvaluationCategoryName.TONE_EMPATHY,
@@ -83,6 +102,12 @@ class EvaluationService:
 
 	@classmethod
 	async def evaluate(cls, request: EvaluationRequest) -> EvaluationResponse:
+		"""Score a transcript in a worker thread so the event loop keeps serving live sessions."""
+		return await asyncio.to_thread(cls._evaluate_sync, request)
+
+	@classmethod
+	def _evaluate_sync(cls, request: EvaluationRequest) -> EvaluationResponse:
+		"""CPU-only evaluation core; batch callers can invoke this directly to skip the thread hop."""
 		messages = cls._prepare_transcript(request.transcript)
 		if not messages:
 			raise ValueError("Conversation transcript is empty.")
@@ -94,7 +119,10 @@ class EvaluationService:
 		product = ProductService.get_product_by_id(request.product_id) if request.product_id else None
 
 		trainee_blob = " ".join(trainee_texts)
-		trainee_words = cls._tokenize(trainee_blob)
+		trainee_blob_lower = trainee_blob.lower()
+		# Tokens from the already-lowercased blob need no per-token lower()
+		trainee_words = _TOKEN_RE.findall(trainee_blob_lower)
+		phrase_hits = cls._count_phrase_hits(trainee_blob_lower)
 
 		scores: Dict[EvaluationCategoryName, int] = {}
 		comments: Dict[EvaluationCategoryName, str] = {}
@@ -105,38 +133,40 @@ class EvaluationService:
 			scores[EvaluationCategoryName.GRAMMAR_CLARITY],
 		)
 
-		scores[EvaluationCategoryName.TONE_EMPATHY] = cls._score_tone_and_empathy(trainee_blob, trainee_words)
+		scores[EvaluationCategoryName.TONE_EMPATHY] = cls._score_tone_and_empathy(trainee_blob, trainee_words, phrase_hits)
 		comments[EvaluationCategoryName.TONE_EMPATHY] = cls._commentary(
 			EvaluationCategoryName.TONE_EMPATHY,
 			scores[EvaluationCategoryName.TONE_EMPATHY],
 		)
 
-		scores[EvaluationCategoryName.PRODUCT_KNOWLEDGE] = cls._score_product_knowledge(trainee_blob, trainee_words, product)
+		scores[EvaluationCategoryName.PRODUCT_KNOWLEDGE] = cls._score_product_knowledge(trainee_blob, trainee_words, product, phrase_hits)
 		comments[EvaluationCategoryName.PRODUCT_KNOWLEDGE] = cls._commentary(
 			EvaluationCategoryName.PRODUCT_KNOWLEDGE,
 			scores[EvaluationCategoryName.PRODUCT_KNOWLEDGE],
 		)
 
-		scores[EvaluationCategoryName.RESPONSE_STRATEGY] = cls._score_response_strategy(trainee_texts, trainee_blob)
+		scores[EvaluationCategoryName.RESPONSE_STRATEGY] = cls._score_response_strategy(trainee_blob, phrase_hits)
 		comments[EvaluationCategoryName.RESPONSE_STRATEGY] = cls._commentary(
 			EvaluationCategoryName.RESPONSE_STRATEGY,
 			scores[EvaluationCategoryName.RESPONSE_STRATEGY],
 		)
 
-		scores[EvaluationCategoryName.SALES_EFFECTIVENESS] = cls._score_sales_effectiveness(trainee_blob)
+		scores[EvaluationCategoryName.SALES_EFFECTIVENESS] = cls._score_sales_effectiveness(trainee_blob, phrase_hits)
 		comments[EvaluationCategoryName.SALES_EFFECTIVENESS] = cls._commentary(
 			EvaluationCategoryName.SALES_EFFECTIVENESS,
 			scores[EvaluationCategoryName.SALES_EFFECTIVENESS],
 		)
 
-		detailed_feedback = [
-			EvaluationCategoryFeedback(category=category, score=score, comment=comments[category])
-			for category, score in scores.items()
-		]
-		order_lookup = {category: index for index, category in enumerate(cls.CATEGORY_SEQUENCE)}
-		detailed_feedback.sort(key=lambda item: order_lookup.get(item.category, len(cls.CATEGORY_SEQUENCE)))
+		# Build in report order directly and total as we go; no post-sort or second pass
+		overall_score = 0
+		detailed_feedback: List[EvaluationCategoryFeedback] = []
+		for category in cls.CATEGORY_SEQUENCE:
+			score = scores[category]
+			overall_score += score
+			detailed_feedback.append(
+				EvaluationCategoryFeedback(category=category, score=score, comment=comments[category])
+			)
 
-		overall_score = sum(item.score for item in detailed_feedback)
 		summary = cls._build_summary(detailed_feedback)
 
 		logger.info(
@@ -178,25 +208,75 @@ class EvaluationService:
 	def _tokenize(text: str) -> List[str]:
 		if not text:
 			return []
-		return re.findall(r"[a-zA-Z']+", text.lower())
+		return _TOKEN_RE.findall(text.lower())
+
+	@classmethod
+	def _init_phrase_matcher(cls) -> None:
+		"""Build a single matcher covering every phrase group (run once at import)."""
+		cls._phrase_groups = {}
+		for group, phrases in _PHRASE_GROUPS.items():
+			for phrase in phrases:
+				cls._phrase_groups.setdefault(phrase, []).append(group)
+
+		cls._automaton = None
+		if ahocorasick is not None:
+			automaton = ahocorasick.Automaton()
+			for phrase in cls._phrase_groups:
+				automaton.add_word(phrase, phrase)
+			automaton.make_automaton()
+			cls._automaton = automaton
+
+		# Default path: one compiled alternation over every group. A zero-width lookahead
+		# finds the longest phrase starting at each offset (overlaps included) and
+		# shorter phrases that prefix it are credited too, so distinct-phrase counts
+		# match plain substring checks.
+		ordered = sorted(cls._phrase_groups, key=len, reverse=True)
+		cls._phrase_re = re.compile("(?=(" + "|".join(re.escape(phrase) for phrase in ordered) + "))")
+		cls._phrase_prefixes = {
+			phrase: [other for other in ordered if other != phrase and phrase.startswith(other)]
+			for phrase in ordered
+		}
+
+	@classmethod
+	def _count_phrase_hits(cls, blob_lower: str) -> Counter:
+		"""Count distinct phrases present per phrase group in one pass over the text."""
+		found: set[str] = set()
+		if cls._automaton is not None:
+			for _, phrase in cls._automaton.iter(blob_lower):
+				found.add(phrase)
+		else:
+			for match in cls._phrase_re.finditer(blob_lower):
+				phrase = match.group(1)
+				found.add(phrase)
+				found.update(cls._phrase_prefixes[phrase])
+
+		hits: Counter = Counter()
+		for phrase in found:
+			for group in cls._phrase_groups[phrase]:
+				hits[group] += 1
+		return hits
 
 	@classmethod
 	def _score_grammar_and_clarity(cls, trainee_texts: List[str], trainee_words: List[str]) -> int:
 		if not trainee_texts:
 			return 10
 
-		sentences: List[str] = []
+		# Count sentences and punctuated messages in one pass over the texts
+		sentence_count = 0
+		punctuated = 0
 		for text in trainee_texts:
-			sentences.extend([segment.strip() for segment in re.split(r"[.!?]+", text) if segment.strip()])
+			sentence_count += sum(1 for segment in _SENTENCE_RE.split(text) if segment and not segment.isspace())
+			if text.rstrip().endswith(_SENTENCE_END):
+				punctuated += 1
 
-		sentence_count = max(1, len(sentences))
+		sentence_count = max(1, sentence_count)
 		word_count = len(trainee_words)
-		avg_sentence_length = word_count / sentence_count if sentence_count else 0
+		avg_sentence_length = word_count / sentence_count
 
-		punctuated = sum(1 for text in trainee_texts if text.strip().endswith((".", "!", "?")))
 		punctuation_ratio = punctuated / max(1, len(trainee_texts))
 
-		filler_hits = sum(1 for word in trainee_words if word in cls.FILLER_WORDS)
+		filler_words = _FILLER_WORDS
+		filler_hits = sum(1 for word in trainee_words if word in filler_words)
 		filler_ratio = filler_hits / max(1, word_count)
 
 		clarity_component = max(0.0, 1.0 - min(1.0, abs(avg_sentence_length - 14) / 14))
@@ -208,14 +288,20 @@ class EvaluationService:
 		return cls._to_twenty_scale(normalized)
 
 	@classmethod
-	def _score_tone_and_empathy(cls, trainee_blob: str, trainee_words: List[str]) -> int:
+	def _score_tone_and_empathy(cls, trainee_blob: str, trainee_words: List[str], phrase_hits: Counter) -> int:
 		if not trainee_blob:
 			return 10
 
-		word_counter = Counter(trainee_words)
-		positive_hits = sum(word_counter[word] for word in cls.POSITIVE_WORDS)
-		negative_hits = sum(word_counter[word] for word in cls.NEGATIVE_WORDS)
-		empathy_hits = sum(1 for phrase in cls.EMPATHY_PHRASES if phrase in trainee_blob.lower())
+		positive_words = _POSITIVE_WORDS
+		negative_words = _NEGATIVE_WORDS
+		positive_hits = 0
+		negative_hits = 0
+		for word in trainee_words:
+			if word in positive_words:
+				positive_hits += 1
+			elif word in negative_words:
+				negative_hits += 1
+		empathy_hits = phrase_hits["empathy"]
 
 		sentiment = positive_hits + 2 * empathy_hits - 2 * negative_hits
 		normalized = max(0.0, min(1.0, (sentiment + 5) / 10))
@@ -227,53 +313,60 @@ class EvaluationService:
 		trainee_blob: str,
 		trainee_words: List[str],
 		product: Optional[object],
+		phrase_hits: Counter,
 	) -> int:
 		if not trainee_blob:
 			return 8
 
-		keywords: set[str] = set()
-		if product:
-			keywords.update(cls._tokenize(product.name))
-			if getattr(product, "tagline", None):
-				keywords.update(cls._tokenize(product.tagline))
-			if getattr(product, "description", None):
-				keywords.update(cls._tokenize(product.description))
-			benefits = getattr(product, "key_benefits", None)
-			if benefits:
-				for benefit in benefits:
-					keywords.update(cls._tokenize(benefit))
-
+		keywords = cls._product_keywords(product.id) if product else frozenset()
 		if not keywords:
-			keywords = {"feature", "benefit", "ingredient", "price", "package", "guarantee"}
+			keywords = _DEFAULT_PRODUCT_KEYWORDS
 
 		word_set = set(trainee_words)
 		matched_keywords = sum(1 for keyword in keywords if keyword in word_set)
-		depth_mentions = sum(1 for phrase in cls.VALUE_PHRASES if phrase in trainee_blob.lower())
+		depth_mentions = phrase_hits["value"]
 
 		coverage = min(1.0, matched_keywords / max(3, len(keywords)))
 		depth_component = min(1.0, depth_mentions / 4)
 		normalized = 0.6 * coverage + 0.4 * depth_component
 		return cls._to_twenty_scale(normalized)
 
+	@staticmethod
+	@lru_cache(maxsize=256)
+	def _product_keywords(product_id: str) -> frozenset[str]:
+		"""Tokenized product copy, memoized per product (the catalog is static)."""
+		product = ProductService.get_product_by_id(product_id)
+		if not product:
+			return frozenset()
+
+		keywords: set[str] = set(EvaluationService._tokenize(product.name))
+		if product.tagline:
+			keywords.update(EvaluationService._tokenize(product.tagline))
+		if product.description:
+			keywords.update(EvaluationService._tokenize(product.description))
+		for benefit in product.key_benefits or ():
+			keywords.update(EvaluationService._tokenize(benefit))
+		return frozenset(keywords)
+
 	@classmethod
-	def _score_response_strategy(cls, trainee_texts: List[str], trainee_blob: str) -> int:
-		if not trainee_texts:
+	def _score_response_strategy(cls, trainee_blob: str, phrase_hits: Counter) -> int:
+		if not trainee_blob:
 			return 10
 
-		question_count = sum(text.count("?") for text in trainee_texts)
-		objection_handling = sum(1 for phrase in cls.OBJECTION_PHRASES if phrase in trainee_blob.lower())
+		# The blob is the space-joined messages, so one count covers every message
+		question_count = trainee_blob.count("?")
+		objection_handling = phrase_hits["objection"]
 
 		normalized = min(1.0, (question_count + 2 * objection_handling) / 8)
 		return cls._to_twenty_scale(normalized)
 
 	@classmethod
-	def _score_sales_effectiveness(cls, trainee_blob: str) -> int:
+	def _score_sales_effectiveness(cls, trainee_blob: str, phrase_hits: Counter) -> int:
 		if not trainee_blob:
 			return 9
 
-		text_lower = trainee_blob.lower()
-		closing_hits = sum(1 for phrase in cls.CLOSING_PHRASES if phrase in text_lower)
-		value_hits = sum(1 for phrase in cls.VALUE_PHRASES if phrase in text_lower)
+		closing_hits = phrase_hits["closing"]
+		value_hits = phrase_hits["value"]
 
 		normalized = min(1.0, (2 * closing_hits + value_hits) / 8)
 		return cls._to_twenty_scale(normalized)
@@ -305,9 +398,13 @@ class EvaluationService:
 		if not feedback:
 			return "No feedback available."
 
-		sorted_feedback = sorted(feedback, key=lambda item: item.score, reverse=True)
-		strengths = sorted_feedback[0]
-		opportunities = sorted_feedback[-1]
+		# Single pass; ties resolve like a stable descending sort (first max, last min)
+		strengths = opportunities = feedback[0]
+		for item in feedback[1:]:
+			if item.score > strengths.score:
+				strengths = item
+			if item.score <= opportunities.score:
+				opportunities = item
 
 		if strengths.category == opportunities.category:
 			return (
@@ -320,3 +417,5 @@ class EvaluationService:
 			f"Prioritize improving {opportunities.category.value.lower()} to lift your next conversation."
 		)
 
+
+EvaluationService._init_phrase_matcher()
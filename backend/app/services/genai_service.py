@@ -1,52 +1,95 @@
 import os
 import asyncio
 import logging
+from functools import lru_cache
 from typing import Optional, Callable, Dict, Any
 import google.generativeai as genai
+from google.generativeai import client as genai_client
 from ..models.session import AgentStatus
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _get_async_client(api_key: str) -> Any:
+    """Return a process-wide Gemini async client per API key.
+
+    Built from its own client manager rather than genai.configure, which would
+    switch the key for every live session and drop their pooled channels.
+    """
+    manager = genai_client._ClientManager()
+    manager.configure(api_key=api_key)
+    return manager.make_client("generative_async")
+
+
 class GenAIService:
+    MESSAGE_QUEUE_SIZE = 64
+    # Queue utilization thresholds for the NORMAL -> ELEVATED -> CRITICAL log signal
+    ELEVATED_WATERMARK = 0.5
+    CRITICAL_WATERMARK = 0.9
+
+    __slots__ = (
+        "api_key",
+        "model",
+        "chat_session",
+        "status",
+        "_persona_instruction",
+        "_on_message_callback",
+        "_on_partial_callback",
+        "_on_status_callback",
+        "_message_queue",
+        "_consumer_task",
+        "_pressure",
+        "_status_tasks",
+        "_status_flush_scheduled",
+        "_status_emitted",
+    )
+
     def __init__(self, api_key: str):
         self.api_key = api_key
-        genai.configure(api_key=api_key)
         self.model: Optional[Any] = None
         self.chat_session: Optional[Any] = None
+        self._persona_instruction: Optional[str] = None
         self.status = AgentStatus.IDLE
         self._on_message_callback: Optional[Callable] = None
+        self._on_partial_callback: Optional[Callable] = None
         self._on_status_callback: Optional[Callable] = None
+        self._message_queue: asyncio.Queue = asyncio.Queue(maxsize=self.MESSAGE_QUEUE_SIZE)
+        self._consumer_task: Optional[asyncio.Task] = None
+        self._pressure = "NORMAL"
+        self._status_tasks: set[asyncio.Task] = set()
+        self._status_flush_scheduled = False
+        self._status_emitted: Optional[AgentStatus] = None
 
     async def create_session(
         self,
         persona_instruction: str,
         on_message_callback: Optional[Callable] = None,
-        on_status_callback: Optional[Callable] = None
+        on_status_callback: Optional[Callable] = None,
+        on_partial_callback: Optional[Callable] = None
     ) -> bool:
-        """Create a new GenAI session using standard API"""
+        """Create a new GenAI session using standard API.
+
+        on_message_callback(text) receives each complete reply; the optional
+        on_partial_callback(text) receives its streamed deltas as they arrive.
+        """
         try:
             self.status = AgentStatus.CONNECTING
             if on_status_callback:
                 await on_status_callback(self.status)
 
-            # Create the model with system instruction
-            self.model = genai.GenerativeModel(
-                model_name='gemini-2.0-flash-exp',
-                system_instruction=persona_instruction,
-                generation_config=genai.GenerationConfig(
-                    temperature=0.8,
-                    top_p=0.95,
-                    max_output_tokens=1024,
-                    response_mime_type="text/plain",
-                ),
-            )
-
-            # Start a chat session
-            self.chat_session = self.model.start_chat(history=[])
+            # Model and chat are built on the first send_text; sessions that
+            # never send a message skip that setup entirely
+            self._persona_instruction = persona_instruction
+            self.model = None
+            self.chat_session = None
             self._on_message_callback = on_message_callback
+            self._on_partial_callback = on_partial_callback
             self._on_status_callback = on_status_callback
 
+            if self._consumer_task is None or self._consumer_task.done():
+                self._consumer_task = asyncio.create_task(self._consume_messages())
+
             self.status = AgentStatus.LISTENING
             if on_status_callback:
                 await on_status_callback(self.status)
@@ -68,44 +111,137 @@ class GenAIService:
 
     async def send_text(self, text: str) -> bool:
         """Send text message to GenAI session"""
-        if not self.chat_session:
+        if self._persona_instruction is None:
             return False
 
         try:
-            self.status = AgentStatus.THINKING
-            if self._on_status_callback:
-                await self._on_status_callback(self.status)
+            self._set_status(AgentStatus.THINKING)
 
-            # Send text message and get response
-            response = await self.chat_session.send_message_async(text)
+            if self.chat_session is None:
+                self._start_chat()
 
-            # Extract text from response
-            response_text = ""
-            if response.text:
-                response_text = response.text.strip()
+            # Stream the response so deltas can be consumed while generating
+            response = await self.chat_session.send_message_async(text, stream=True)
 
+            parts = []
+            async for chunk in response:
+                delta = chunk.text
+                if not delta:
+                    continue
+                parts.append(delta)
+                # Forward tokens as they arrive to callers that asked for them
+                if self._on_partial_callback:
+                    await self._enqueue_message(delta, is_partial=True)
+
+            response_text = "".join(parts).strip()
+
+            # Hand off to the dispatch task; it only holds us up once the queue is full
             if response_text and self._on_message_callback:
-                await self._on_message_callback(response_text)
+                await self._enqueue_message(response_text, is_partial=False)
 
-            self.status = AgentStatus.LISTENING
-            if self._on_status_callback:
-                await self._on_status_callback(self.status)
+            self._set_status(AgentStatus.LISTENING)
 
             logger.info(f"Sent text message and received response: {len(response_text)} chars")
             return True
         except Exception as e:
             logger.error(f"Failed to send text: {e}")
-            self.status = AgentStatus.ERROR
-            if self._on_status_callback:
-                await self._on_status_callback(self.status)
+            self._set_status(AgentStatus.ERROR)
             return False
 
+    def _start_chat(self):
+        """Build the model and chat session for the stored persona"""
+        self.model = genai.GenerativeModel(
+            model_name='gemini-2.0-flash-exp',
+            system_instruction=self._persona_instruction,
+            generation_config=genai.GenerationConfig(
+                temperature=0.8,
+                top_p=0.95,
+                max_output_tokens=1024,
+                response_mime_type="text/plain",
+            ),
+        )
+        # The model would otherwise fall back to the globally configured client
+        self.model._async_client = _get_async_client(self.api_key)
+        self.chat_session = self.model.start_chat(history=[])
+
+    def _set_status(self, status: AgentStatus):
+        """Update status and schedule the callback without awaiting it.
+
+        Updates made within one loop tick are coalesced; only the latest is emitted.
+        """
+        self.status = status
+        if self._on_status_callback and not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_status)
+
+    def _flush_status(self):
+        """Emit the latest status once for everything set since the last flush"""
+        self._status_flush_scheduled = False
+        status = self.status
+        if status == self._status_emitted or not self._on_status_callback:
+            return
+        self._status_emitted = status
+        task = asyncio.ensure_future(self._on_status_callback(status))
+        self._status_tasks.add(task)
+        task.add_done_callback(self._on_status_task_done)
+
+    def _on_status_task_done(self, task: asyncio.Task):
+        self._status_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Error in GenAI status callback: {task.exception()}")
+
+    async def _consume_messages(self):
+        """Deliver queued replies and deltas to their callbacks"""
+        while True:
+            text, is_partial = await self._message_queue.get()
+            callback = self._on_partial_callback if is_partial else self._on_message_callback
+            try:
+                if callback:
+                    await callback(text)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in GenAI message callback: {e}")
+            finally:
+                self._message_queue.task_done()
+
+    async def _enqueue_message(self, text: str, is_partial: bool = False):
+        """Queue a response for dispatch, waiting for room when the queue is full.
+
+        Partials are deltas, so none can be dropped without corrupting the
+        streamed text; a full queue slows generation down instead.
+        """
+        item = (text, is_partial)
+        try:
+            self._message_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.warning("GenAI message queue full; waiting for the consumer")
+            await self._message_queue.put(item)
+
+        utilization = self._message_queue.qsize() / self.MESSAGE_QUEUE_SIZE
+        if utilization >= self.CRITICAL_WATERMARK:
+            pressure = "CRITICAL"
+        elif utilization >= self.ELEVATED_WATERMARK:
+            pressure = "ELEVATED"
+        else:
+            pressure = "NORMAL"
+        if pressure != self._pressure:
+            logger.warning(f"GenAI message queue pressure {self._pressure} -> {pressure} ({utilization:.0%})")
+            self._pressure = pressure
+
     async def close_session(self):
         """Close the GenAI session"""
         try:
+            # Stop message dispatch; the consumer holds no resources that need
+            # teardown, so there is no need to wait for the cancellation to land
+            if self._consumer_task and not self._consumer_task.done():
+                self._consumer_task.cancel()
+            self._consumer_task = None
+
             # Clear the session
             self.chat_session = None
             self.model = None
+            self._persona_instruction = None
             self.status = AgentStatus.IDLE
             logger.info("GenAI session closed")
         except Exception as e:
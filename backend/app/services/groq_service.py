@@ -1,24 +1,143 @@
 import os
 import asyncio
 import logging
-from typing import Optional, Callable, Dict, Any, List
+from collections import deque
+from functools import lru_cache
+from typing import Optional, Callable, Deque, Dict, Any, List, AsyncIterator, Mapping, Sequence, Tuple, TypeVar
+import httpx
 from groq import AsyncGroq
+try:
+    import tiktoken
+except ImportError:  # Optional exact-ish counts; _estimate_tokens falls back to ~4 chars per token
+    tiktoken = None
 from ..models.session import AgentStatus
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_STREAM_BUFFER_SIZE = 8
+_END_OF_STREAM = object()
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> AsyncGroq:
+    """Return a process-wide Groq client per API key so sessions reuse warm connections"""
+    return AsyncGroq(
+        api_key=api_key,
+        # The SDK backs off exponentially on connection errors, 429s and 5xx;
+        # with no warmup probe this is what covers the first real request
+        max_retries=3,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=60.0,
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Optional[Any]:
+    """cl100k_base when tiktoken is installed and its BPE file loads, else None"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating tokens by length: {e}")
+        return None
+
+
+def _estimate_tokens(text: str) -> int:
+    """Prompt token count used for the history budget.
+
+    With tiktoken this counts cl100k_base tokens. Llama 3's 128k vocabulary
+    extends those 100k merges, so English counts land within a few percent of
+    Groq's. Without it, ~4 chars per token is within ~15% for English prose
+    but can undercount digits and non-Latin text by 2-3x; MAX_PROMPT_TOKENS
+    sits far enough under the model's context that this only loosens the
+    budget.
+    """
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text or "", disallowed_special=())) + 1
+    return len(text or "") // 4 + 1
+
+
+async def _buffered(source: AsyncIterator[T], size: int) -> AsyncIterator[T]:
+    """Pull from source in a background task, up to size items ahead of the consumer"""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+    error: Optional[BaseException] = None
+
+    async def produce() -> None:
+        nonlocal error
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as e:
+            error = e
+        await queue.put(_END_OF_STREAM)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END_OF_STREAM:
+                break
+            yield item
+        if error is not None:
+            raise error
+    finally:
+        producer.cancel()
+
 
 class GroqService:
     """Service for handling LLM interactions using Groq API"""
+
+    # Recent user/assistant turns sent verbatim; older ones are folded into a summary
+    MAX_TURNS = 16
+    SUMMARY_MAX_TOKENS = 200
+    # Rough prompt budget (system + summary + turns), measured with _estimate_tokens
+    MAX_PROMPT_TOKENS = 6000
+    # Compaction shrinks the window to this fraction of its limits, so it runs
+    # once every several turns instead of on every turn past the limit
+    COMPACT_TARGET_RATIO = 0.5
+
+    __slots__ = (
+        "api_key",
+        "client",
+        "status",
+        "_conversation_history",
+        "_on_message_callback",
+        "_on_status_callback",
+        "_status_tasks",
+        "_status_flush_scheduled",
+        "_status_emitted",
+        "_system_msg",
+        "_summary",
+        "_summary_msg",
+        "_system_tokens",
+        "_history_tokens",
+        "_compaction_task",
+    )
     
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.client = AsyncGroq(api_key=api_key)
+        self.client = _get_client(api_key)
         self.status = AgentStatus.IDLE
-        self._conversation_history: List[Dict[str, str]] = []
+        # User/assistant turns only; system prompt and summary are kept outside.
+        # maxlen is a hard backstop, compaction normally keeps it at MAX_TURNS pairs
+        self._conversation_history: Deque[Dict[str, str]] = deque(maxlen=self.MAX_TURNS * 4)
         self._on_message_callback: Optional[Callable] = None
         self._on_status_callback: Optional[Callable] = None
-        self._system_prompt: str = ""
+        self._status_tasks: set[asyncio.Task] = set()
+        self._status_flush_scheduled = False
+        self._status_emitted: Optional[AgentStatus] = None
+        self._system_msg: Dict[str, str] = {"role": "system", "content": ""}
+        self._summary: str = ""
+        self._summary_msg: Optional[Dict[str, str]] = None
+        self._system_tokens = 0
+        self._history_tokens = 0
+        self._compaction_task: Optional[asyncio.Task] = None
 
     async def initialize_session(
         self,
@@ -28,62 +147,179 @@ class GroqService:
     ) -> bool:
         """Initialize a new Groq LLM session"""
         try:
-            self.status = AgentStatus.CONNECTING
-            if on_status_callback:
-                await on_status_callback(self.status)
-
             # Store callbacks and system prompt
             self._on_message_callback = on_message_callback
             self._on_status_callback = on_status_callback
-            self._system_prompt = persona_instruction
-            
+            self._system_msg = {"role": "system", "content": persona_instruction}
+            # The first load may fetch the BPE file, so keep it off the event loop
+            await asyncio.to_thread(_get_encoding)
+            # Counted once per session; the window check reuses it every turn
+            self._system_tokens = _estimate_tokens(persona_instruction)
+
+            self._set_status(AgentStatus.CONNECTING)
+
             # Clear conversation history
-            self._conversation_history = [
-                {"role": "system", "content": persona_instruction}
-            ]
+            self._cancel_compaction()
+            self._conversation_history.clear()
+            self._history_tokens = 0
+            self._summary = ""
+            self._summary_msg = None
 
-            # Test the connection with a simple call
-            test_response = await self.client.chat.completions.create(
-                model="llama-3.1-8b-instant",
-                messages=[{"role": "user", "content": "Hello"}],
-                max_tokens=10,
-                temperature=0.1
-            )
+            # No warmup request: the shared client connects on the first real
+            # call, and auth errors surface there just the same
+            if not self.api_key:
+                raise ValueError("Groq API key is not configured")
 
-            self.status = AgentStatus.LISTENING
-            if on_status_callback:
-                await on_status_callback(self.status)
+            self._set_status(AgentStatus.LISTENING)
 
             logger.info("Groq LLM session initialized successfully")
             return True
 
         except Exception as e:
             logger.error(f"Failed to initialize Groq session: {e}")
-            self.status = AgentStatus.ERROR
-            if on_status_callback:
-                await on_status_callback(self.status)
+            self._set_status(AgentStatus.ERROR)
             return False
 
+    async def warm_up(self):
+        """Open a pooled connection ahead of the first completion request"""
+        try:
+            await self.client.models.list()
+        except Exception as e:
+            logger.warning(f"Groq connection warm-up failed: {e}")
+
+    def _set_status(self, status: AgentStatus):
+        """Update status, notifying the callback only when it actually changes.
+
+        The callback is scheduled rather than awaited so status pushes overlap
+        the LLM request instead of adding loop round trips around it. Updates
+        made within one loop tick are coalesced; only the latest is emitted.
+        """
+        if status == self.status:
+            return
+        self.status = status
+        if self._on_status_callback and not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_status)
+
+    def _flush_status(self):
+        """Emit the latest status once for everything set since the last flush"""
+        self._status_flush_scheduled = False
+        status = self.status
+        if status == self._status_emitted or not self._on_status_callback:
+            return
+        self._status_emitted = status
+        task = asyncio.ensure_future(self._on_status_callback(status))
+        self._status_tasks.add(task)
+        task.add_done_callback(self._on_status_task_done)
+
+    def _on_status_task_done(self, task: asyncio.Task):
+        self._status_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Error in Groq status callback: {task.exception()}")
+
+    def _needs_compaction(self) -> bool:
+        token_budget = self.MAX_PROMPT_TOKENS - self._system_tokens - self.SUMMARY_MAX_TOKENS
+        return len(self._conversation_history) > self.MAX_TURNS * 2 or self._history_tokens > token_budget
+
+    def _schedule_compaction(self):
+        """Compact in the background once a reply is out, so the summary call
+        overlaps the trainee's next turn instead of delaying it"""
+        if self._needs_compaction() and (self._compaction_task is None or self._compaction_task.done()):
+            self._compaction_task = asyncio.create_task(self._compact_history())
+
+    async def _await_compaction(self):
+        """Let a pending compaction finish before the history is read for a request"""
+        task = self._compaction_task
+        if task is not None and not task.done():
+            # wait() neither raises if a reset cancelled it nor cancels it with us
+            await asyncio.wait({task})
+
+    def _cancel_compaction(self):
+        if self._compaction_task is not None and not self._compaction_task.done():
+            self._compaction_task.cancel()
+        self._compaction_task = None
+
+    async def _compact_history(self):
+        """Keep the system prompt, a rolling summary and the most recent turns.
+
+        Once the window exceeds MAX_TURNS turns or MAX_PROMPT_TOKENS, it is cut
+        to COMPACT_TARGET_RATIO of both limits and the older turns are folded
+        into the summary.
+        """
+        history = self._conversation_history
+        token_budget = self.MAX_PROMPT_TOKENS - self._system_tokens - self.SUMMARY_MAX_TOKENS
+        max_messages = int(self.MAX_TURNS * 2 * self.COMPACT_TARGET_RATIO)
+        max_tokens = int(token_budget * self.COMPACT_TARGET_RATIO)
+        older: List[Dict[str, str]] = []
+        # Always keep the newest message, even if it alone exceeds the budget
+        while len(history) > 1 and (len(history) > max_messages or self._history_tokens > max_tokens):
+            turn = history.popleft()
+            self._history_tokens -= _estimate_tokens(turn["content"])
+            older.append(turn)
+        if not older:
+            return
+
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in older)
+        if self._summary:
+            transcript = f"Earlier summary: {self._summary}\n{transcript}"
+
+        try:
+            response = await self.client.chat.completions.create(
+                model="llama-3.1-8b-instant",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "Summarize this sales conversation in a few sentences. "
+                                   "Keep names, needs, objections and commitments."
+                    },
+                    {"role": "user", "content": transcript}
+                ],
+                max_tokens=self.SUMMARY_MAX_TOKENS,
+                temperature=0.2
+            )
+            self._summary = (response.choices[0].message.content or "").strip()
+        except Exception as e:
+            # Still trim; losing detail beats unbounded request growth
+            logger.warning(f"Failed to summarize Groq history, dropping {len(older)} messages: {e}")
+
+        if self._summary:
+            self._summary_msg = {"role": "system", "content": f"Summary so far: {self._summary}"}
+        logger.info(f"Compacted Groq history: folded {len(older)} messages into summary")
+
+    def _append_turn(self, role: str, content: str):
+        """Append a turn, keeping the running token estimate in step"""
+        history = self._conversation_history
+        if len(history) == history.maxlen:
+            self._history_tokens -= _estimate_tokens(history[0]["content"])
+        history.append({"role": role, "content": content})
+        self._history_tokens += _estimate_tokens(content)
+
+    def _messages(self) -> Tuple[Dict[str, str], ...]:
+        """Request payload: system prompt, optional summary, then recent turns"""
+        if self._summary_msg:
+            return (self._system_msg, self._summary_msg, *self._conversation_history)
+        return (self._system_msg, *self._conversation_history)
+
     async def send_message(self, message: str, user_role: str = "user") -> Optional[str]:
         """Send a message to Groq and get response"""
         if self.status == AgentStatus.ERROR:
             return None
 
         try:
-            self.status = AgentStatus.SPEAKING
-            if self._on_status_callback:
-                await self._on_status_callback(self.status)
+            self._set_status(AgentStatus.SPEAKING)
+
+            await self._await_compaction()
 
             # Add user message to conversation history
-            self._conversation_history.append({
-                "role": user_role,
-                "content": message
-            })
+            self._append_turn(user_role, message)
+            if self._needs_compaction():
+                # Backstop if the previous compaction failed or was skipped
+                await self._compact_history()
 
             # Get response from Groq
             response = await self.client.chat.completions.create(
                 model="llama-3.1-8b-instant",
-                messages=self._conversation_history,
+                messages=self._messages(),
                 max_tokens=1024,
                 temperature=0.8,
                 top_p=0.95,
@@ -93,27 +329,22 @@ class GroqService:
             assistant_message = response.choices[0].message.content
             
             # Add assistant response to conversation history
-            self._conversation_history.append({
-                "role": "assistant", 
-                "content": assistant_message
-            })
+            self._append_turn("assistant", assistant_message)
+            self._schedule_compaction()
+
+            # Status push is scheduled, so it runs alongside the message callback
+            self._set_status(AgentStatus.LISTENING)
 
             # Trigger callback with the response
             if self._on_message_callback:
                 await self._on_message_callback(assistant_message)
 
-            self.status = AgentStatus.LISTENING
-            if self._on_status_callback:
-                await self._on_status_callback(self.status)
-
             logger.info(f"Groq response generated: {len(assistant_message)} characters")
             return assistant_message
 
         except Exception as e:
             logger.error(f"Failed to get Groq response: {e}")
-            self.status = AgentStatus.ERROR
-            if self._on_status_callback:
-                await self._on_status_callback(self.status)
+            self._set_status(AgentStatus.ERROR)
             return None
 
     async def stream_message(self, message: str, user_role: str = "user") -> None:
@@ -122,77 +353,75 @@ class GroqService:
             return
 
         try:
-            self.status = AgentStatus.SPEAKING
-            if self._on_status_callback:
-                await self._on_status_callback(self.status)
+            self._set_status(AgentStatus.SPEAKING)
+            await self._await_compaction()
 
             # Add user message to conversation history
-            self._conversation_history.append({
-                "role": user_role,
-                "content": message
-            })
+            self._append_turn(user_role, message)
+
+            if self._needs_compaction():
+                # Backstop if the previous compaction failed or was skipped
+                await self._compact_history()
 
             # Get streaming response from Groq
             stream = await self.client.chat.completions.create(
                 model="llama-3.1-8b-instant",
-                messages=self._conversation_history,
+                messages=self._messages(),
                 max_tokens=1024,
                 temperature=0.8,
                 top_p=0.95,
                 stream=True
             )
 
-            full_response = ""
-            async for chunk in stream:
+            parts: List[str] = []
+            # Keep reading the SSE stream while the callback awaits downstream sends
+            async for chunk in _buffered(stream, _STREAM_BUFFER_SIZE):
                 if chunk.choices[0].delta.content:
                     content = chunk.choices[0].delta.content
-                    full_response += content
+                    parts.append(content)
 
                     # Send partial response via callback
                     if self._on_message_callback:
                         await self._on_message_callback(content, is_partial=True)
 
-                    # Small delay to create word-by-word effect
-                    await asyncio.sleep(0.05)
+            full_response = "".join(parts)
+
+            # Status push is scheduled, so it runs alongside the final callback
+            self._set_status(AgentStatus.LISTENING)
 
             # Add complete response to conversation history
             if full_response:
-                self._conversation_history.append({
-                    "role": "assistant",
-                    "content": full_response
-                })
+                self._append_turn("assistant", full_response)
+                self._schedule_compaction()
 
                 # Send final complete response
                 if self._on_message_callback:
                     await self._on_message_callback(full_response, is_partial=False)
 
-            self.status = AgentStatus.LISTENING
-            if self._on_status_callback:
-                await self._on_status_callback(self.status)
-
             logger.info(f"Groq streaming response completed: {len(full_response)} characters")
 
         except Exception as e:
             logger.error(f"Failed to stream Groq response: {e}")
-            self.status = AgentStatus.ERROR
-            if self._on_status_callback:
-                await self._on_status_callback(self.status)
+            self._set_status(AgentStatus.ERROR)
 
     async def reset_conversation(self):
         """Reset the conversation history"""
-        self._conversation_history = [
-            {"role": "system", "content": self._system_prompt}
-        ]
+        self._cancel_compaction()
+        self._conversation_history.clear()
+        self._history_tokens = 0
+        self._summary = ""
+        self._summary_msg = None
         logger.info("Conversation history reset")
 
-    def get_conversation_history(self) -> List[Dict[str, str]]:
-        """Get the current conversation history"""
-        return self._conversation_history.copy()
+    def get_conversation_history(self) -> Sequence[Mapping[str, str]]:
+        """Get the current conversation history as a read-only snapshot"""
+        return self._messages()
 
     async def close_session(self):
         """Close the Groq session"""
         try:
             # Cleanup any resources if needed
+            self._cancel_compaction()
             self._conversation_history.clear()
             self.status = AgentStatus.IDLE
             logger.info("Groq session closed")
@@ -1,25 +1,69 @@
-import os
+import re
 import asyncio
 import logging
-import json
-import base64
+from binascii import b2a_base64
 import time
-from typing import Optional, Callable, Dict, Any, List
-from livekit import api, rtc
+from collections import deque
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Awaitable, Callable, Deque, Dict, Any, List, Tuple
+from livekit import rtc
 # Note: livekit.agents imports temporarily commented out due to version compatibility
 # from livekit.agents import llm, stt, tts, vad
-from ..models.session import AgentStatus
+try:
+    import pybase64
+except ImportError:  # Optional SIMD encoder; stdlib base64 is the fallback
+    pybase64 = None
+from ..models.session import AgentStatus, TranscriptEvent
 from ..core.config import get_settings
 from .groq_service import GroqService
-from .deepgram_service import DeepgramService
+from .deepgram_service import DeepgramService, DeepgramChannel, DeepgramMultiplexer
 from .openai_service import OpenAITTSService
 
 logger = logging.getLogger(__name__)
 
+async def _noop_callback(*args, **kwargs) -> None:
+    """Default for unset callbacks"""
+    return None
+
+
+# Shared across sessions so large audio encodes don't block the event loop
+_ENCODE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audio-encode")
+
+
+# End of a sentence in streamed LLM text: terminal punctuation, optional
+# closing quotes/brackets, then whitespace
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s+")
+# Clause break, used only to get the first audio of a reply started sooner
+_CLAUSE_END = re.compile(r"[,;:]\s+")
+
+
+def _b64encode_str(data: bytes) -> str:
+    """Base64-encode to str, using pybase64's vectorized encoder when installed"""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return b2a_base64(data, newline=False).decode('ascii')
+
 
 class LiveKitOrchestrationService:
     """Service for orchestrating real-time conversations using LiveKit with VAD and turn detection"""
 
+    # Streamed TTS chunks are coalesced into one websocket message per flush
+    AUDIO_BATCH_MAX_CHUNKS = 8
+    AUDIO_BATCH_MAX_BYTES = 16 * 1024
+    AUDIO_BATCH_DELAY = 0.005  # seconds
+    # Per-service limit on a close during cleanup
+    SERVICE_CLOSE_TIMEOUT = 3.0  # seconds
+    # Upper bound on how long incoming track audio waits before going to STT
+    STT_MAX_BATCH_DELAY = 0.04  # seconds
+    # Below this size base64 is cheaper inline than a hop to the encode pool
+    AUDIO_OFFLOAD_MIN_BYTES = 64 * 1024
+    # Batched track audio waiting for the STT sender; oldest is shed when full
+    STT_QUEUE_SIZE = 64
+    # With nothing playing yet, a clause this long is spoken without waiting
+    # for the rest of its sentence
+    TTS_FIRST_CLAUSE_MIN_CHARS = 40
+
     def __init__(self, api_key: str, api_secret: str, ws_url: str):
         self.api_key = api_key
         self.api_secret = api_secret
@@ -28,14 +72,23 @@ class LiveKitOrchestrationService:
         self.agent = None
         self.status = AgentStatus.IDLE
         self._is_active = True
-        self._on_message_callback: Optional[Callable] = None
-        self._on_status_callback: Optional[Callable] = None
-        self._on_transcript_callback: Optional[Callable] = None
+        # No-op defaults so hot paths can await callbacks without None checks
+        self._on_message_callback: Callable = _noop_callback
+        self._on_status_callback: Callable = _noop_callback
+        self._on_transcript_callback: Callable = _noop_callback
 
         # AI Services
         self.groq_service: Optional[GroqService] = None
-        self.stt_service: Optional[DeepgramService] = None
+        # Bound once Groq is up so message dispatch is a single call
+        self._llm_stream: Optional[Callable] = None
+        # Background connection warm-up started once the session is up
+        self._warmup_task: Optional[asyncio.Task] = None
+        self.stt_service: Optional[DeepgramService | DeepgramChannel] = None
         self.tts_service: Optional[OpenAITTSService] = None
+        # TTS is built on first use from these (api key, voice); the task is
+        # shared so concurrent first uses wait on one handshake
+        self._tts_config: Optional[Tuple[str, str]] = None
+        self._tts_init_task: Optional[asyncio.Task] = None
 
         # VAD and pipeline configuration
         self.vad_instance = None
@@ -48,6 +101,38 @@ class LiveKitOrchestrationService:
         self._last_user_final_ts: float = 0.0
         self._current_tts_task: Optional[asyncio.Task] = None
         self._tts_interrupting: bool = False
+        # Streamed LLM text not yet ending in a sentence boundary
+        self._llm_partial_buf: List[str] = []
+        # Text waiting for the running TTS task, and whether the current LLM
+        # response is still feeding it (None closes the pipeline)
+        self._tts_queue: Optional[asyncio.Queue] = None
+        self._tts_queue_open = False
+        # Each streamed LLM reply gets a generation; once the user barges in,
+        # the rest of that reply's text is never spoken
+        self._reply_generation = 0
+        self._interrupted_generation = -1
+
+        # Outgoing audio batching (see _on_audio_generated)
+        self._audio_out_buf: Deque[bytes] = deque()
+        self._audio_out_bytes = 0
+        self._audio_out_meta: Optional[Tuple] = None
+        self._audio_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._audio_flush_tasks: set[asyncio.Task] = set()
+        self._audio_send_lock = asyncio.Lock()
+
+        # Services currently in ERROR, maintained from their own transition reports
+        self._service_errors: set[str] = set()
+
+        # Status changes are coalesced and emitted by a single publisher task
+        self._status_dirty = asyncio.Event()
+
+        # Track audio is handed to a single STT sender so a slow Deepgram
+        # socket cannot stall frame ingestion
+        self._stt_queue: asyncio.Queue = asyncio.Queue(maxsize=self.STT_QUEUE_SIZE)
+
+        # Long-lived session workers (status publisher, STT sender) run in one
+        # TaskGroup owned by this task; cancelling it reaps all of them
+        self._workers_task: Optional[asyncio.Task] = None
 
         # Deferred user processing to handle natural pauses
         self._settings = get_settings()
@@ -72,127 +157,44 @@ class LiveKitOrchestrationService:
         """Initialize LiveKit orchestration session"""
         try:
             logger.info("Starting LiveKit orchestration session initialization")
-            self.status = AgentStatus.CONNECTING
-            if on_status_callback:
-                await on_status_callback(self.status)
 
             # Store callbacks
-            self._on_message_callback = on_message_callback
-            self._on_status_callback = on_status_callback
-            self._on_transcript_callback = on_transcript_callback
+            self._on_message_callback = on_message_callback or _noop_callback
+            self._on_status_callback = on_status_callback or _noop_callback
+            self._on_transcript_callback = on_transcript_callback or _noop_callback
             self.reset_turn_state()
+            self._service_errors.clear()
+            if self._workers_task is None or self._workers_task.done():
+                self._workers_task = asyncio.create_task(self._run_workers())
 
-            # Initialize AI services with error handling
-            services_initialized = []
-
-            # Initialize Groq service
-            logger.info("Initializing Groq service...")
-            try:
-                self.groq_service = GroqService(groq_api_key)
-                groq_success = await self.groq_service.initialize_session(
-                    persona_instruction,
-                    self._on_llm_response,
-                    self._on_service_status_change
-                )
-                if groq_success:
-                    services_initialized.append("Groq")
-                    logger.info("Groq service initialized successfully")
-                else:
-                    logger.warning("Groq service initialization returned False")
-            except Exception as e:
-                logger.error(f"Failed to initialize Groq service: {e}")
-                logger.error(f"Groq API key length: {len(groq_api_key) if groq_api_key else 0}")
-                self.groq_service = None
-
-            # Initialize Deepgram service
-            logger.info("Initializing Deepgram service...")
-            try:
-                # More detailed logging for API key
-                api_key_length = len(deepgram_api_key) if deepgram_api_key else 0
-                logger.info(f"Deepgram API key check - Length: {api_key_length}, First 4 chars: {deepgram_api_key[:4] if api_key_length > 4 else 'N/A'}")
-                
-                if not deepgram_api_key or api_key_length == 0:
-                    logger.error("Deepgram API key is missing or empty")
-                    raise ValueError("Deepgram API key is required")
-                
-                # Create service instance
-                self.stt_service = DeepgramService(
-                    deepgram_api_key,
-                    extra_query_params=self._settings.deepgram_stream_params,
-                )
-                logger.info("Deepgram service instance created successfully")
-
-                # Initialize session with detailed error reporting
-                try:
-                    stt_success = await self.stt_service.initialize(
-                        on_transcript_callback=self._on_transcript_received
-                    )
-                    logger.info(f"Deepgram initialization result: {stt_success}")
-                except Exception as init_error:
-                    logger.error(f"Deepgram initialization error: {str(init_error)}")
-                    raise
-
-                if stt_success:
-                    try:
-                        # Check connection status with safer attribute access
-                        is_connected = self.stt_service.is_connected()
-                        status = self.stt_service.get_status()
-                        
-                        logger.info(f"Deepgram Status Check:")
-                        logger.info(f"- Connected: {is_connected}")
-                        logger.info(f"- Service Status: {status}")
-                        logger.info(f"- WebSocket State: {'CONNECTED' if is_connected else 'DISCONNECTED'}")
-
-                        if is_connected:
-                            services_initialized.append("Deepgram")
-                            logger.info("✓ Deepgram service initialized and connected successfully")
-                        else:
-                            logger.warning("⚠ Deepgram service initialized but not connected")
-                            logger.error("Connection failed after initialization")
-                            # Keep service instance for potential reconnection
-                            logger.warning("Keeping Deepgram service instance for potential reconnection")
-                    except Exception as e:
-                        logger.error(f"Error checking Deepgram connection: {e}")
-                        logger.error("Continuing with degraded STT functionality")
-                else:
-                    logger.error("✗ Deepgram service initialization failed")
-                    logger.error(f"Service status: {self.stt_service.get_status() if self.stt_service else 'No service instance'}")
-                    self.stt_service = None
-            except Exception as e:
-                logger.error(f"Failed to initialize Deepgram service: {e}")
-                logger.error(f"Exception type: {type(e).__name__}")
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
-                self.stt_service = None
-
-            # Initialize OpenAI TTS service for AI responses
-            logger.info("Initializing OpenAI TTS service for AI...")
-            try:
-                self.tts_service = OpenAITTSService(openai_api_key, openai_tts_voice)
-                tts_success = await self.tts_service.initialize_session(
-                    voice=openai_tts_voice,
-                    model="tts-1",
-                    on_audio_callback=self._on_audio_generated,
-                    on_error_callback=self._on_service_error
-                )
-                if tts_success:
-                    services_initialized.append("OpenAI TTS (AI)")
-                    logger.info("OpenAI TTS service for AI initialized successfully")
-                else:
-                    logger.warning("OpenAI TTS service for AI initialization returned False")
-            except Exception as e:
-                logger.error(f"Failed to initialize OpenAI TTS service for AI: {e}")
-                logger.error(f"OpenAI API key length: {len(openai_api_key) if openai_api_key else 0}")
-                logger.error(f"OpenAI TTS voice: {openai_tts_voice}")
-                self.tts_service = None
-
-            # Check if required services are available (Groq and AI TTS)
+            # Goes out through the publisher while the services below initialize
+            self.status = AgentStatus.CONNECTING
+            self._publish_status()
+
+            # TTS is only needed once the AI speaks; defer its setup to first use
+            self.tts_service = None
+            self._tts_config = (openai_api_key, openai_tts_voice)
+            self._tts_init_task = None
+
+            # Initialize AI services concurrently; each helper logs its own outcome
+            # and returns the service name on success
+            results = await asyncio.gather(
+                self._init_groq(groq_api_key, persona_instruction),
+                self._init_stt(deepgram_api_key, room_name),
+            )
+            services_initialized = [name for name in results if name]
+
+            # Check if required services are available (Groq; TTS is optional)
             if not services_initialized or "Groq" not in services_initialized:
                 logger.error("No AI services could be initialized - Groq is required")
                 raise Exception("Groq service is required for the system to work")
 
             logger.info(f"Successfully initialized services: {', '.join(services_initialized)}")
 
+            # Open the Groq connection now so the first reply skips the TLS
+            # handshake; not awaited, init does not wait on it
+            self._warmup_task = asyncio.create_task(self.groq_service.warm_up())
+
             # Create room and connect
             await self._create_and_connect_room(room_name)
             
@@ -200,8 +202,7 @@ class LiveKitOrchestrationService:
             logger.info("VAD and pipeline features disabled - using direct service integration")
 
             self.status = AgentStatus.LISTENING
-            if on_status_callback:
-                await on_status_callback(self.status)
+            self._publish_status()
 
             logger.info(f"LiveKit orchestration session initialized for room: {room_name}")
             return True
@@ -213,6 +214,170 @@ class LiveKitOrchestrationService:
                 await on_status_callback(self.status)
             return False
 
+    async def _init_groq(self, groq_api_key: str, persona_instruction: str) -> Optional[str]:
+        """Create and initialize the Groq LLM service"""
+        logger.info("Initializing Groq service...")
+        try:
+            self.groq_service = GroqService(groq_api_key)
+            groq_success = await self.groq_service.initialize_session(
+                persona_instruction,
+                self._on_llm_response,
+                partial(self._on_service_status_change, service="groq")
+            )
+            if groq_success:
+                self._llm_stream = self.groq_service.stream_message
+                logger.info("Groq service initialized successfully")
+                return "Groq"
+            logger.warning("Groq service initialization returned False")
+        except Exception as e:
+            logger.error("Failed to initialize Groq service: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Groq API key length: %d", len(groq_api_key) if groq_api_key else 0)
+            self.groq_service = None
+        self._llm_stream = None
+        return None
+
+    async def _init_stt(self, deepgram_api_key: str, room_name: str) -> Optional[str]:
+        """Create and connect the Deepgram STT service"""
+        logger.info("Initializing Deepgram service...")
+        try:
+            # More detailed logging for API key
+            api_key_length = len(deepgram_api_key) if deepgram_api_key else 0
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Deepgram API key check - Length: %d", api_key_length)
+            
+            if not deepgram_api_key or api_key_length == 0:
+                logger.error("Deepgram API key is missing or empty")
+                raise ValueError("Deepgram API key is required")
+            
+            # Create service instance (shared multichannel socket when enabled)
+            multiplex_channels = self._settings.deepgram_multiplex_channels
+            if multiplex_channels > 1:
+                multiplexer = DeepgramMultiplexer.get_instance(
+                    deepgram_api_key,
+                    channels=multiplex_channels,
+                    extra_query_params=self._settings.deepgram_stream_params,
+                )
+                self.stt_service = multiplexer.get_channel(room_name)
+                if self.stt_service is None:
+                    raise RuntimeError("No free Deepgram multiplexer channel")
+            else:
+                self.stt_service = DeepgramService(
+                    deepgram_api_key,
+                    extra_query_params=self._settings.deepgram_stream_params,
+                )
+            logger.info("Deepgram service instance created successfully")
+
+            # Initialize session with detailed error reporting
+            try:
+                stt_success = await self.stt_service.initialize(
+                    on_transcript_callback=self._on_transcript_received
+                )
+                logger.info(f"Deepgram initialization result: {stt_success}")
+            except Exception as init_error:
+                logger.error(f"Deepgram initialization error: {str(init_error)}")
+                raise
+
+            if stt_success:
+                try:
+                    # Check connection status with safer attribute access
+                    is_connected = self.stt_service.is_connected()
+                    status = self.stt_service.get_status()
+                    
+                    logger.info("Deepgram Status Check: connected=%s, status=%s", is_connected, status)
+
+                    if is_connected:
+                        logger.info("✓ Deepgram service initialized and connected successfully")
+                        return "Deepgram"
+                    else:
+                        logger.warning("⚠ Deepgram service initialized but not connected")
+                        logger.error("Connection failed after initialization")
+                        # Keep service instance for potential reconnection
+                        logger.warning("Keeping Deepgram service instance for potential reconnection")
+                except Exception as e:
+                    logger.error(f"Error checking Deepgram connection: {e}")
+                    logger.error("Continuing with degraded STT functionality")
+            else:
+                logger.error("✗ Deepgram service initialization failed")
+                logger.error(f"Service status: {self.stt_service.get_status() if self.stt_service else 'No service instance'}")
+                self.stt_service = None
+        except Exception as e:
+            logger.error(f"Failed to initialize Deepgram service: {e}")
+            logger.error(f"Exception type: {type(e).__name__}")
+            import traceback
+            logger.error(f"Full traceback: {traceback.format_exc()}")
+            self.stt_service = None
+        return None
+
+    async def _init_tts(self, openai_api_key: str, openai_tts_voice: str) -> Optional[str]:
+        """Create and initialize the OpenAI TTS service for AI responses"""
+        logger.info("Initializing OpenAI TTS service for AI...")
+        try:
+            tts_service = OpenAITTSService(openai_api_key, openai_tts_voice)
+            tts_success = await tts_service.initialize_session(
+                voice=openai_tts_voice,
+                model="tts-1",
+                on_audio_callback=self._on_audio_generated,
+                on_error_callback=self._on_service_error
+            )
+            if tts_success:
+                self.tts_service = tts_service
+                logger.info("OpenAI TTS service for AI initialized successfully")
+                return "OpenAI TTS (AI)"
+            logger.warning("OpenAI TTS service for AI initialization returned False")
+        except Exception as e:
+            logger.error("Failed to initialize OpenAI TTS service for AI: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("OpenAI API key length: %d, TTS voice: %s", len(openai_api_key) if openai_api_key else 0, openai_tts_voice)
+            self.tts_service = None
+        return None
+
+    def _tts_enabled(self) -> bool:
+        """True when TTS is up or can still be set up on first use"""
+        return self.tts_service is not None or self._tts_config is not None
+
+    def _prepare_tts(self) -> Optional[asyncio.Task]:
+        """Start TTS setup in the background if it has not been started yet"""
+        if self._tts_init_task is None and self._tts_config is not None:
+            openai_api_key, openai_tts_voice = self._tts_config
+            self._tts_init_task = asyncio.create_task(self._init_tts(openai_api_key, openai_tts_voice))
+        return self._tts_init_task
+
+    async def _get_tts(self) -> Optional[OpenAITTSService]:
+        """Return the TTS service, setting it up on first use"""
+        if self.tts_service is None:
+            task = self._prepare_tts()
+            if task is not None:
+                # Shielded so a cancelled caller does not abort the shared setup
+                await asyncio.shield(task)
+                self._tts_config = None
+        return self.tts_service
+
+    async def _run_workers(self):
+        """Run the session workers until cancelled by close_session"""
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._run_status_publisher())
+            tg.create_task(self._stt_consumer())
+
+    def _publish_status(self):
+        """Flag a status change; transitions within one loop tick emit only the latest"""
+        self._status_dirty.set()
+
+    async def _run_status_publisher(self):
+        """Emit the current status to the client whenever it has been flagged dirty"""
+        last_sent: Optional[AgentStatus] = None
+        while True:
+            await self._status_dirty.wait()
+            self._status_dirty.clear()
+            status = self.status
+            if status == last_sent:
+                continue
+            last_sent = status
+            try:
+                await self._on_status_callback(status)
+            except Exception as e:
+                logger.error(f"Error publishing status {status}: {e}")
+
     async def _create_and_connect_room(self, room_name: str):
         """Create and connect to LiveKit room"""
         try:
@@ -231,25 +396,23 @@ class LiveKitOrchestrationService:
 
     async def _on_participant_connected(self, participant: rtc.RemoteParticipant):
         """Handle participant connection"""
-        logger.info(f"Participant connected: {participant.identity}")
+        logger.info("Participant connected: %s", participant.identity)
         
-        if self._on_message_callback:
-            await self._on_message_callback(f"Participant {participant.identity} joined the session")
+        await self._on_message_callback(f"Participant {participant.identity} joined the session")
 
     async def _on_participant_disconnected(self, participant: rtc.RemoteParticipant):
         """Handle participant disconnection"""
-        logger.info(f"Participant disconnected: {participant.identity}")
+        logger.info("Participant disconnected: %s", participant.identity)
         
-        if self._on_message_callback:
-            await self._on_message_callback(f"Participant {participant.identity} left the session")
+        await self._on_message_callback(f"Participant {participant.identity} left the session")
 
     async def _on_track_published(self, publication: rtc.RemoteTrackPublication, participant: rtc.RemoteParticipant):
         """Handle track publication"""
-        logger.info(f"Track published: {publication.sid} by {participant.identity}")
+        logger.info("Track published: %s by %s", publication.sid, participant.identity)
 
     async def _on_track_subscribed(self, track: rtc.Track, publication: rtc.RemoteTrackPublication, participant: rtc.RemoteParticipant):
         """Handle track subscription - this is where we process audio"""
-        logger.info(f"Track subscribed: {track.sid} from {participant.identity}")
+        logger.info("Track subscribed: %s from %s", track.sid, participant.identity)
         
         if track.kind == rtc.TrackKind.KIND_AUDIO:
             # Start processing audio from this track
@@ -261,63 +424,123 @@ class LiveKitOrchestrationService:
             # Create audio stream
             audio_stream = rtc.AudioStream(track)
             
-            # Process audio frames
+            if not self.stt_service:
+                return
+            enqueue = self._enqueue_stt_audio
+
+            # Coalesce 10-20ms frames into ~stt_batch_ms sends; flush early if a
+            # batch has been open longer than STT_MAX_BATCH_DELAY
+            batch_ms = max(self._settings.stt_batch_ms, 0)
+            loop = asyncio.get_running_loop()
+            # Fixed-size accumulator written in place, sized on the first frame
+            view: Optional[memoryview] = None
+            filled = 0
+            target_bytes = 0
+            last_flush = loop.time()
+
             async for frame in audio_stream:
-                # Convert audio frame to bytes and send to STT
-                audio_data = frame.data.tobytes()
-                if self.stt_service:
-                    await self.stt_service.send_audio_data(audio_data)
+                data = memoryview(frame.data).cast('B')
+                size = len(data)
+                if view is None:
+                    target_bytes = frame.sample_rate * frame.num_channels * 2 * batch_ms // 1000
+                    # Room for a full batch plus the frame that crosses the threshold
+                    view = memoryview(bytearray(target_bytes + size))
+
+                if filled + size > len(view):
+                    # Frame larger than the first one; send what is held first
+                    if filled:
+                        enqueue(bytes(view[:filled]))
+                        filled = 0
+                    if size > len(view):
+                        enqueue(bytes(data))
+                        last_flush = loop.time()
+                        continue
+
+                view[filled:filled + size] = data
+                filled += size
+
+                now = loop.time()
+                if filled >= target_bytes or now - last_flush >= self.STT_MAX_BATCH_DELAY:
+                    enqueue(bytes(view[:filled]))
+                    filled = 0
+                    last_flush = now
+
+            if filled:
+                enqueue(bytes(view[:filled]))
                     
         except Exception as e:
-            logger.error(f"Error processing audio track: {e}")
+            logger.error("Error processing audio track: %s", e)
+
+    def _enqueue_stt_audio(self, audio_data: bytes):
+        """Queue batched track audio for STT, shedding the oldest batch when full"""
+        try:
+            self._stt_queue.put_nowait(audio_data)
+        except asyncio.QueueFull:
+            logger.warning("STT audio queue full; dropping oldest batch")
+            self._stt_queue.get_nowait()
+            self._stt_queue.put_nowait(audio_data)
+
+    async def _stt_consumer(self):
+        """Send queued track audio to the STT service one batch at a time"""
+        while True:
+            audio_data = await self._stt_queue.get()
+            stt_service = self.stt_service
+            if not stt_service:
+                continue
+            try:
+                await stt_service.send_audio_bytes(audio_data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error sending audio to STT: %s", e)
 
     async def _on_track_unsubscribed(self, track: rtc.Track, publication: rtc.RemoteTrackPublication, participant: rtc.RemoteParticipant):
         """Handle track unsubscription"""
-        logger.info(f"Track unsubscribed: {track.sid} from {participant.identity}")
+        logger.info("Track unsubscribed: %s from %s", track.sid, participant.identity)
 
     async def _on_transcript_received(self, transcript_data: dict):
         """Handle transcript from STT service"""
         try:
             if not self._is_active:
                 return
+            # Bound at entry so the event goes to the session's callback even if
+            # it is swapped while the interrupt below is awaited
+            emit_transcript = self._on_transcript_callback
 
             raw_text = transcript_data.get("text", "")
             text = raw_text.strip()
             is_final = transcript_data.get("is_final", False)
+            if not text and not is_final:
+                # Blank interims carry nothing; finals still close the open segment
+                return
             confidence = transcript_data.get("confidence")
 
-            log_message = f"[STT] Received transcript in LiveKit service: '{raw_text}' (final: {is_final}, confidence: {confidence})"
-            if is_final:
-                logger.info(log_message)
-            else:
-                logger.debug(log_message)
+            # Interim results arrive many times per second; format only if the level is enabled
+            logger.log(
+                logging.INFO if is_final else logging.DEBUG,
+                "[STT] Received transcript in LiveKit service: '%s' (final: %s, confidence: %s)",
+                raw_text, is_final, confidence,
+            )
 
-            if transcript_data.get("speaker") == "Trainee":
+            speaker = transcript_data.get("speaker")
+            if speaker == "Trainee":
                 if not is_final and text:
+                    # The trainee has started talking; get TTS ready for the reply
+                    self._prepare_tts()
                     if self.is_ai_speaking():
                         await self.interrupt_ai_speech("trainee_started_speaking")
                     self._schedule_user_processing(text, transcript_data.get("id"))
                 elif is_final and text:
                     self._finalize_user_processing(text, transcript_data.get("id"))
+            else:
+                speaker = "Customer"
 
-                if self._on_transcript_callback:
-                    await self._on_transcript_callback({
-                        "text": raw_text,
-                        "is_final": is_final,
-                        "confidence": confidence,
-                        "speaker": "Trainee"
-                    })
-                else:
-                    logger.debug("[WebSocket] No transcript callback available")
-                return
-
-            if self._on_transcript_callback:
-                await self._on_transcript_callback({
-                    "text": raw_text,
-                    "is_final": is_final,
-                    "confidence": confidence,
-                    "speaker": "Customer"
-                })
+            await emit_transcript(TranscriptEvent(
+                text=raw_text,
+                is_final=is_final,
+                speaker=speaker,
+                confidence=confidence,
+            ))
 
         except Exception as e:
             logger.error(f"Error handling transcript: {e}")
@@ -329,20 +552,29 @@ class LiveKitOrchestrationService:
                 if not self._is_active:
                     return
 
-                if not self.groq_service:
+                if not self._llm_stream:
                     logger.warning("[LLM] Groq service not available")
                     return
 
-                logger.info(f"[LLM] Processing trainee message: '{text}'")
+                logger.info("[LLM] Processing trainee message: '%s'", text)
                 self.status = AgentStatus.THINKING
-                if self._on_status_callback:
-                    await self._on_status_callback(self.status)
-
-                await self.groq_service.stream_message(text)
+                self._publish_status()
+                await self._stream_llm(text)
 
         except Exception as e:
             logger.error(f"Error while handling final transcript: {e}")
 
+    async def _stream_llm(self, text: str):
+        """Stream an LLM reply to text; responses arrive via _on_llm_response"""
+        # Overlap TTS setup with generation of the first reply
+        self._prepare_tts()
+        self._reply_generation += 1
+        try:
+            await self._llm_stream(text)
+        finally:
+            # A failed stream never delivers its final response
+            self._close_tts_queue()
+
     def _resolve_transcript_id(self, transcript_id: Optional[Any]) -> int:
         if isinstance(transcript_id, int):
             return transcript_id
@@ -427,6 +659,7 @@ class LiveKitOrchestrationService:
         self._last_final_user_text = None
         self._last_ai_response = None
         self._last_user_final_ts = 0.0
+        self._llm_partial_buf.clear()
         if self._pending_user_task is not None and not self._pending_user_task.done():
             self._pending_user_task.cancel()
         self._pending_user_task = None
@@ -449,7 +682,8 @@ class LiveKitOrchestrationService:
 
         self._tts_interrupting = True
         try:
-            logger.info(f"[TTS] Interrupt requested: {reason}")
+            logger.info("[TTS] Interrupt requested: %s", reason)
+            self._interrupted_generation = self._reply_generation
             stopped = await self._stop_tts_playback(reason=reason, notify_client=True)
             return stopped
         finally:
@@ -463,6 +697,18 @@ class LiveKitOrchestrationService:
         if task is None and not stream_active:
             return False
 
+        # Drop audio still waiting for a batch flush; it belongs to the stopped stream
+        self._discard_audio_batch()
+
+        # Drop text not yet spoken so the TTS task ends with the current stream
+        queue = self._tts_queue
+        if queue is not None:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+            self._tts_queue = None
+        self._tts_queue_open = False
+
         if self.tts_service is not None:
             try:
                 await self.tts_service.stop_stream(reason=reason)
@@ -483,7 +729,7 @@ class LiveKitOrchestrationService:
 
         self._current_tts_task = None
 
-        if notify_client and self._on_message_callback:
+        if notify_client:
             try:
                 await self._on_message_callback({
                     "type": "audio_stop",
@@ -494,27 +740,39 @@ class LiveKitOrchestrationService:
 
         if update_status and self._is_active:
             self.status = AgentStatus.LISTENING
-            if self._on_status_callback:
-                await self._on_status_callback(self.status)
+            self._publish_status()
 
         return True
 
     async def _start_tts_stream(self, text: str):
         """Start streaming TTS audio for the provided text."""
-        if not self.tts_service:
+        queue = await self._start_tts_pipeline()
+        if queue is not None:
+            queue.put_nowait(text)
+            queue.put_nowait(None)
+
+    async def _start_tts_pipeline(self) -> Optional[asyncio.Queue]:
+        """Start a TTS task that speaks queued text in order until a None sentinel."""
+        if not await self._get_tts():
             logger.warning("[TTS] AI TTS service not available for response")
             if self._is_active:
                 self.status = AgentStatus.LISTENING
-                if self._on_status_callback:
-                    await self._on_status_callback(self.status)
-            return
+                self._publish_status()
+            return None
 
         await self._stop_tts_playback(reason="replace_ai_tts", notify_client=False, update_status=False)
 
+        queue: asyncio.Queue = asyncio.Queue()
+        self._tts_queue = queue
+
         async def run_tts():
             task_ref = asyncio.current_task()
             try:
-                await self.tts_service.stream_text_to_speech(text)
+                while True:
+                    text = await queue.get()
+                    if text is None:
+                        break
+                    await self.tts_service.stream_text_to_speech(text)
             except asyncio.CancelledError:
                 logger.info("[TTS] Streaming task cancelled")
                 raise
@@ -523,16 +781,57 @@ class LiveKitOrchestrationService:
             finally:
                 if self._current_tts_task is task_ref:
                     self._current_tts_task = None
+                if self._tts_queue is queue:
+                    self._tts_queue = None
+                    self._tts_queue_open = False
                 if self._is_active and self.status != AgentStatus.ERROR:
                     self.status = AgentStatus.LISTENING
-                    if self._on_status_callback:
-                        await self._on_status_callback(self.status)
+                    self._publish_status()
 
         self.status = AgentStatus.SPEAKING
-        if self._on_status_callback:
-            await self._on_status_callback(self.status)
+        self._publish_status()
 
         self._current_tts_task = asyncio.create_task(run_tts())
+        return queue
+
+    def _reply_interrupted(self) -> bool:
+        return self._interrupted_generation == self._reply_generation
+
+    async def _speak_partial(self, delta: str):
+        """Buffer streamed LLM text and send each completed sentence to TTS"""
+        if self._reply_interrupted():
+            self._llm_partial_buf.clear()
+            return
+        self._llm_partial_buf.append(delta)
+        text = "".join(self._llm_partial_buf)
+        end = 0
+        for match in _SENTENCE_END.finditer(text):
+            end = match.end()
+        if not end and not self._tts_queue_open and len(text) >= self.TTS_FIRST_CLAUSE_MIN_CHARS:
+            for match in _CLAUSE_END.finditer(text):
+                end = match.end()
+        if not end:
+            return
+
+        self._llm_partial_buf.clear()
+        if end < len(text):
+            self._llm_partial_buf.append(text[end:])
+
+        if not self._tts_queue_open:
+            if await self._start_tts_pipeline() is None:
+                return
+            self._tts_queue_open = True
+        self._tts_queue.put_nowait(text[:end].strip())
+
+    def _close_tts_queue(self, tail: str = ""):
+        """Queue any remaining text and let the TTS task finish after it"""
+        self._llm_partial_buf.clear()
+        if not self._tts_queue_open:
+            return
+        self._tts_queue_open = False
+        if tail:
+            self._tts_queue.put_nowait(tail)
+        self._tts_queue.put_nowait(None)
 
     async def _on_llm_response(self, response: str, is_partial: bool = False):
         """Handle response from LLM service"""
@@ -540,42 +839,70 @@ class LiveKitOrchestrationService:
             if not self._is_active:
                 return
 
-            logger.info(f"[LLM] Received response: '{response}' (partial: {is_partial})")
+            logger.log(
+                logging.DEBUG if is_partial else logging.INFO,
+                "[LLM] Received response: '%s' (partial: %s)", response, is_partial,
+            )
 
-            if self._on_transcript_callback:
-                await self._on_transcript_callback({
-                    "text": response,
-                    "is_final": not is_partial,
-                    "speaker": "AI Assistant"
-                })
+            event = TranscriptEvent(
+                text=response,
+                is_final=not is_partial,
+                speaker="AI Assistant",
+            )
 
             if is_partial:
+                await self._on_transcript_callback(event)
                 # Reset last AI response marker while streaming chunks
                 self._last_ai_response = None
+                if self._tts_enabled():
+                    # Speak finished sentences while the rest is still generating
+                    await self._speak_partial(response)
                 return
 
-            final_response = response.strip()
-            if not final_response:
-                return
+            # Ship the final transcript while its speech is being set up
+            results = await asyncio.gather(
+                self._on_transcript_callback(event),
+                self._speak_final_response(response),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error handling LLM response: {result}")
 
-            if final_response == self._last_ai_response:
-                logger.debug("[TTS] Duplicate final AI response detected, skipping speech generation")
-                return
+        except Exception as e:
+            logger.error(f"Error handling LLM response: {e}")
 
-            self._last_ai_response = final_response
+    async def _speak_final_response(self, response: str):
+        """Speak a complete LLM response, or the tail of one already streaming"""
+        final_response = response.strip()
+        if self._reply_interrupted():
+            # The user talked over this reply; don't replay it from the start
+            self._llm_partial_buf.clear()
+            self._last_ai_response = final_response or None
+            return
+        if self._tts_queue_open:
+            # Earlier sentences are already queued; only the tail is left
+            self._close_tts_queue("".join(self._llm_partial_buf).strip())
+            self._last_ai_response = final_response or None
+            return
+        self._llm_partial_buf.clear()
 
-            if self.tts_service:
-                logger.info(f"[TTS] Generating AI speech for response: '{final_response}'")
-                await self._start_tts_stream(final_response)
-            else:
-                logger.warning("[TTS] AI TTS service not available for response")
-                self.status = AgentStatus.LISTENING
-                if self._on_status_callback:
-                    await self._on_status_callback(self.status)
+        if not final_response:
+            return
 
-        except Exception as e:
-            logger.error(f"Error handling LLM response: {e}")
+        if final_response == self._last_ai_response:
+            logger.debug("[TTS] Duplicate final AI response detected, skipping speech generation")
+            return
 
+        self._last_ai_response = final_response
+
+        if self._tts_enabled():
+            logger.info("[TTS] Generating AI speech for response: '%s'", final_response)
+            await self._start_tts_stream(final_response)
+        else:
+            logger.warning("[TTS] AI TTS service not available for response")
+            self.status = AgentStatus.LISTENING
+            self._publish_status()
 
     async def _on_audio_generated(self, audio_bytes: bytes, mime_type: str, is_stream: bool = False, bit_rate: Optional[int] = None, codec: Optional[str] = None, sample_rate: Optional[int] = None, channels: Optional[int] = None, bit_depth: Optional[int] = None, encoding: Optional[str] = None):
         """Handle generated audio from AI TTS service"""
@@ -583,76 +910,153 @@ class LiveKitOrchestrationService:
             if not self._is_active:
                 return
 
-            logger.info(f"[TTS] AI audio generated: {len(audio_bytes)} bytes, mime_type: {mime_type}, is_stream: {is_stream}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[TTS] AI audio generated: %d bytes, mime_type: %s, is_stream: %s", len(audio_bytes), mime_type, is_stream)
 
-            # Publish audio to LiveKit room
-            if self.room and audio_bytes:
-                await self._publish_audio_to_room(audio_bytes)
+            # Room publishing is not implemented yet (room connection is skipped in
+            # _create_and_connect_room); when it is, do it inline here rather than
+            # through a separate awaited hop per chunk
 
-            # Also send via callback for WebSocket clients
-            if self._on_message_callback:
-                audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
-                logger.info(f"[WebSocket] Sending AI audio to client: {len(audio_base64)} base64 chars")
+            # Also send via callback for WebSocket clients, batching streamed chunks
+            if audio_bytes and self._on_message_callback is not _noop_callback:
                 # Use provided metadata when available, otherwise sensible defaults
                 resolved_mime = mime_type or "audio/mpeg"
-                resolved_sample_rate = sample_rate or (24000 if "mp3" in resolved_mime or "mpeg" in resolved_mime else 16000)
-                resolved_channels = channels or 1
-                resolved_bit_rate = bit_rate or 192000
-                resolved_codec = codec or ("mp3" if "mp3" in resolved_mime or "mpeg" in resolved_mime else None)
-                resolved_bit_depth = bit_depth
-                resolved_encoding = encoding
-                await self._on_message_callback({
-                    "type": "audio",
-                    "data": audio_base64,
-                    "mime_type": resolved_mime,
-                    "sample_rate": resolved_sample_rate,
-                    "channels": resolved_channels,
-                    "bit_rate": resolved_bit_rate,
-                    "codec": resolved_codec,
-                    "bit_depth": resolved_bit_depth,
-                    "encoding": resolved_encoding,
-                    "speaker": "AI Assistant"
-                })
+                is_mpeg = "mp3" in resolved_mime or "mpeg" in resolved_mime
+                meta = (
+                    resolved_mime,
+                    sample_rate or (24000 if is_mpeg else 16000),
+                    channels or 1,
+                    bit_rate or 192000,
+                    codec or ("mp3" if is_mpeg else None),
+                    bit_depth,
+                    encoding,
+                )
+                if self._audio_out_meta is not None and meta != self._audio_out_meta:
+                    await self._flush_audio()
+
+                self._audio_out_meta = meta
+                # The deque is cleared in place on flush, never replaced
+                buf = self._audio_out_buf
+                buf.append(audio_bytes)
+                pending_bytes = self._audio_out_bytes + len(audio_bytes)
+                self._audio_out_bytes = pending_bytes
+
+                if (
+                    not is_stream
+                    or len(buf) >= self.AUDIO_BATCH_MAX_CHUNKS
+                    or pending_bytes >= self.AUDIO_BATCH_MAX_BYTES
+                ):
+                    await self._flush_audio()
+                elif self._audio_flush_handle is None:
+                    self._audio_flush_handle = asyncio.get_running_loop().call_later(
+                        self.AUDIO_BATCH_DELAY, self._schedule_audio_flush
+                    )
 
             if not is_stream:  # Only update status when complete audio is generated
                 logger.info("[Status] AI finished speaking, setting status to listening")
                 self.status = AgentStatus.LISTENING
-                if self._on_status_callback:
-                    await self._on_status_callback(self.status)
+                self._publish_status()
 
         except Exception as e:
             logger.error(f"Error handling AI generated audio: {e}")
 
-    async def _publish_audio_to_room(self, audio_bytes: bytes):
-        """Publish audio to LiveKit room"""
-        try:
-            # Create audio track and publish
-            # Note: This is a simplified version - actual implementation may need
-            # proper audio format conversion and streaming
-            pass  # Placeholder for actual audio publishing logic
-        except Exception as e:
-            logger.error(f"Error publishing audio to room: {e}")
+    def _schedule_audio_flush(self):
+        """Timer callback: flush whatever audio accumulated within the batch delay"""
+        self._audio_flush_handle = None
+        task = asyncio.create_task(self._flush_audio())
+        self._audio_flush_tasks.add(task)
+        task.add_done_callback(self._audio_flush_tasks.discard)
+
+    async def _flush_audio(self):
+        """Send buffered audio chunks as one message: a JSON header followed by a
+        binary frame, or a single base64 JSON message in legacy mode"""
+        async with self._audio_send_lock:
+            if self._audio_flush_handle is not None:
+                self._audio_flush_handle.cancel()
+                self._audio_flush_handle = None
+            if not self._audio_out_buf:
+                return
+
+            audio_bytes = b"".join(self._audio_out_buf)
+            chunk_count = len(self._audio_out_buf)
+            meta = self._audio_out_meta
+            self._audio_out_buf.clear()
+            self._audio_out_bytes = 0
+            self._audio_out_meta = None
 
-    async def _on_service_status_change(self, status: AgentStatus):
+            mime_type, sample_rate, channels, bit_rate, codec, bit_depth, encoding = meta
+            if self._settings.ws_binary_audio:
+                logger.debug("[WebSocket] Sending AI audio to client: %d chunks, %d bytes", chunk_count, len(audio_bytes))
+                try:
+                    await self._on_message_callback({
+                        "type": "audio_header",
+                        "length": len(audio_bytes),
+                        "mime_type": mime_type,
+                        "sample_rate": sample_rate,
+                        "channels": channels,
+                        "bit_rate": bit_rate,
+                        "codec": codec,
+                        "bit_depth": bit_depth,
+                        "encoding": encoding,
+                        "speaker": "AI Assistant"
+                    })
+                    await self._on_message_callback(audio_bytes)
+                except Exception as e:
+                    logger.error(f"Error sending AI audio to client: {e}")
+                return
+
+            if len(audio_bytes) >= self.AUDIO_OFFLOAD_MIN_BYTES:
+                audio_base64 = await asyncio.get_running_loop().run_in_executor(
+                    _ENCODE_POOL, _b64encode_str, audio_bytes
+                )
+            else:
+                audio_base64 = _b64encode_str(audio_bytes)
+            logger.debug("[WebSocket] Sending AI audio to client: %d chunks, %d base64 chars", chunk_count, len(audio_base64))
+            try:
+                await self._on_message_callback({
+                    "type": "audio",
+                    "data": audio_base64,
+                    "mime_type": mime_type,
+                    "sample_rate": sample_rate,
+                    "channels": channels,
+                    "bit_rate": bit_rate,
+                    "codec": codec,
+                    "bit_depth": bit_depth,
+                    "encoding": encoding,
+                    "speaker": "AI Assistant"
+                })
+            except Exception as e:
+                logger.error(f"Error sending AI audio to client: {e}")
+
+    def _discard_audio_batch(self):
+        """Drop pending outgoing audio without sending it"""
+        if self._audio_flush_handle is not None:
+            self._audio_flush_handle.cancel()
+            self._audio_flush_handle = None
+        self._audio_out_buf.clear()
+        self._audio_out_bytes = 0
+        self._audio_out_meta = None
+
+    async def _on_service_status_change(self, status: AgentStatus, service: str):
         """Handle status changes from AI services"""
-        # Aggregate status from all services
+        # Aggregate from the tracked error set rather than polling every service
         if status == AgentStatus.ERROR:
+            self._service_errors.add(service)
             self.status = AgentStatus.ERROR
         else:
-            # Check status of available services only
-            available_services = [service for service in [self.groq_service, self.stt_service, self.tts_service] if service is not None]
-            if available_services and all(service.get_status() != AgentStatus.ERROR for service in available_services):
+            self._service_errors.discard(service)
+            if not self._service_errors:
                 self.status = status
 
-        if self._on_status_callback:
-            await self._on_status_callback(self.status)
+        self._publish_status()
 
     async def _on_service_error(self, error_message: str):
         """Handle errors from AI services"""
         logger.error(f"AI service error: {error_message}")
+        # Only the TTS service reports through this callback, and its ERROR is sticky
+        self._service_errors.add("tts")
         self.status = AgentStatus.ERROR
-        if self._on_status_callback:
-            await self._on_status_callback(self.status)
+        self._publish_status()
 
     async def send_text_message(self, text: str) -> bool:
         """Send a text message through the pipeline"""
@@ -661,8 +1065,8 @@ class LiveKitOrchestrationService:
                 return False
 
             # Send to Groq LLM with streaming
-            if self.groq_service:
-                await self.groq_service.stream_message(text)
+            if self._llm_stream:
+                await self._stream_llm(text)
                 return True
             logger.warning("Groq service not available")
             return False
@@ -671,7 +1075,7 @@ class LiveKitOrchestrationService:
             return False
 
     async def cleanup(self):
-        """Clean up all services in proper order"""
+        """Stop playback, then close all services concurrently"""
         # Stop accepting new messages
         self._is_active = False
 
@@ -680,55 +1084,29 @@ class LiveKitOrchestrationService:
         except Exception as e:
             logger.error(f"Error stopping TTS during cleanup: {e}")
 
-        # Add small delay to let fast pending operations complete (protected)
-        try:
-            await asyncio.sleep(0.1)
-        except asyncio.CancelledError:
-            # Propagate cancellation so shutdown proceeds immediately
-            logger.info("Cleanup interrupted during initial sleep; re-raising CancelledError")
-            raise
-
         logger.info("Starting service cleanup...")
 
         # Wrap each service closure so a CancelledError in one doesn't prevent other cleanups
         try:
-            # 1. Stop accepting new audio first
+            # Handlers are already gated by _is_active and playback is stopped,
+            # so the closes do not depend on each other; run them together
+            self._tts_config = None
+            if self._tts_init_task and not self._tts_init_task.done():
+                self._tts_init_task.cancel()
+            self._tts_init_task = None
+            self._llm_stream = None
+            if self._warmup_task and not self._warmup_task.done():
+                self._warmup_task.cancel()
+            self._warmup_task = None
+
+            closers = []
             if self.stt_service:
-                try:
-                    logger.info("Closing Deepgram service...")
-                    await asyncio.wait_for(self.stt_service.close(), timeout=3.0)
-                except asyncio.CancelledError:
-                    logger.info("Deepgram close was cancelled; re-raising CancelledError")
-                    raise
-                except Exception as e:
-                    logger.error(f"Error closing Deepgram service: {e}")
-
-            # 2. Wait briefly for any pending TTS operations (protected from cancellation)
-            try:
-                await asyncio.sleep(0.1)
-            except asyncio.CancelledError:
-                logger.info("Cleanup sleep interrupted; continuing with remaining shutdown steps")
-
-            # 3. Close TTS services
+                closers.append(self._close_service("Deepgram", self.stt_service.close()))
             if self.tts_service:
-                try:
-                    await self.tts_service.close_session()
-                except asyncio.CancelledError:
-                    logger.info("TTS close was cancelled; re-raising CancelledError")
-                    raise
-                except Exception as e:
-                    logger.error(f"Error closing TTS service: {e}")
-
-            # 4. Finally close LLM
+                closers.append(self._close_service("TTS", self.tts_service.close_session()))
             if self.groq_service:
-                try:
-                    logger.info("Closing Groq service...")
-                    await self.groq_service.close_session()
-                except asyncio.CancelledError:
-                    logger.info("Groq close was cancelled; re-raising CancelledError")
-                    raise
-                except Exception as e:
-                    logger.error(f"Error closing Groq service: {e}")
+                closers.append(self._close_service("Groq", self.groq_service.close_session()))
+            await asyncio.gather(*closers)
 
             logger.info("All services cleaned up (best-effort)")
             self.reset_turn_state()
@@ -737,17 +1115,37 @@ class LiveKitOrchestrationService:
             # Ensure cancellation propagates to the caller so the runtime can shut down quickly
             logger.info("Cleanup received CancelledError; re-raising to allow immediate shutdown")
             raise
-        except asyncio.TimeoutError:
-            logger.warning("Service cleanup timed out, forcing shutdown")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
 
+    async def _close_service(self, name: str, close: Awaitable[None]):
+        """Await one service close, logging failures so the others still run"""
+        try:
+            logger.info("Closing %s service...", name)
+            await asyncio.wait_for(close, timeout=self.SERVICE_CLOSE_TIMEOUT)
+        except asyncio.CancelledError:
+            logger.info("%s close was cancelled; re-raising CancelledError", name)
+            raise
+        except asyncio.TimeoutError:
+            logger.warning("%s close timed out after %.1fs", name, self.SERVICE_CLOSE_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Error closing {name} service: {e}")
+
     async def close_session(self):
         """Close the LiveKit orchestration session"""
         try:
             # Use the new cleanup method for proper shutdown order
             await self.cleanup()
 
+            workers = self._workers_task
+            self._workers_task = None
+            if workers and not workers.done():
+                workers.cancel()
+                # Wait for the group to finish unwinding its children
+                await asyncio.gather(workers, return_exceptions=True)
+            while not self._stt_queue.empty():
+                self._stt_queue.get_nowait()
+
             # Disconnect from room
             if self.room:
                 await self.room.disconnect()
@@ -1,8 +1,12 @@
 import os
 import asyncio
+import hashlib
 import logging
 import base64
+import time
+from functools import lru_cache
 from typing import Optional, Callable, Dict, Any, List
+import httpx
 from openai import AsyncOpenAI
 from ..models.session import AgentStatus
 
@@ -15,13 +19,34 @@ try:
 except Exception:
     pass
 
+# Keys that passed the connection probe recently, by digest -> monotonic time
+_KEY_VALIDATION_TTL = 300.0  # seconds
+_validated_keys: Dict[str, float] = {}
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Return a process-wide OpenAI client per API key so sessions reuse warm connections"""
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+            timeout=60.0,
+        ),
+    )
+
+
+def _key_digest(api_key: str) -> str:
+    """Digest used to remember a key without keeping the secret itself"""
+    return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+
 
 class OpenAITTSService:
     def __init__(self, api_key: str, voice: str = "alloy", model: str = "tts-1"):
         self.api_key = api_key
         self.voice = voice
         self.model = model
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = _get_client(api_key)
         self.status = AgentStatus.IDLE
         self._on_audio_callback: Optional[Callable] = None
         self._on_error_callback: Optional[Callable] = None
@@ -96,11 +121,17 @@ class OpenAITTSService:
             self._on_audio_callback = on_audio_callback
             self._on_error_callback = on_error_callback
 
-            # Test the connection by making a simple API call
-            try:
-                await self.client.models.list()
-            except Exception as e:
-                raise Exception(f"Failed to connect to OpenAI API: {e}")
+            # Test the connection by making a simple API call, unless another
+            # session validated this key within the TTL
+            digest = _key_digest(self.api_key or "")
+            validated_at = _validated_keys.get(digest)
+            if validated_at is None or time.monotonic() - validated_at >= _KEY_VALIDATION_TTL:
+                try:
+                    await self.client.models.list()
+                except Exception as e:
+                    _validated_keys.pop(digest, None)
+                    raise Exception(f"Failed to connect to OpenAI API: {e}")
+                _validated_keys[digest] = time.monotonic()
 
             self.status = AgentStatus.LISTENING
             logger.info(f"OpenAI TTS session initialized with voice: {self.voice}, model: {self.model}")
@@ -235,7 +266,7 @@ class OpenAITTSService:
                 response_format=response_format
             ) as response:
                 self._active_stream_response = response
-                # Stream audio chunks with small delay for better real-time experience
+                # Forward chunks as they arrive; the client queues them for playback
                 async for chunk in response.iter_bytes(chunk_size=1024):
                     if stop_event.is_set():
                         logger.info("OpenAI TTS stream stop requested; ending stream early")
@@ -271,8 +302,6 @@ class OpenAITTSService:
                         else:
                             mime_type = f"audio/{response_format}"
                             await self._on_audio_callback(chunk, mime_type, is_stream=True)
-                    # Small delay to prevent overwhelming the audio playback
-                    await asyncio.sleep(0.01)
 
             if not stopped_early:
                 logger.info(f"Completed streaming OpenAI TTS for text: {text[:50]}...")
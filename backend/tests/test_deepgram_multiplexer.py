@@ -0,0 +1,166 @@
+"""DeepgramMultiplexer frame interleaving and channel release.
+
+Run from backend/: python -m pytest tests
+"""
+import asyncio
+
+import numpy as np
+
+from app.services.deepgram_service import DeepgramMultiplexer, DeepgramService
+
+FRAME = DeepgramMultiplexer.FRAME_BYTES
+
+
+class FakeService(DeepgramService):
+    """Records frames instead of sending them to Deepgram"""
+
+    def __init__(self, gate: asyncio.Event = None):
+        super().__init__("key", channels=2)
+        self.frames = []
+        self.closed = 0
+        self._gate = gate
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def initialize_session(self, on_transcript_callback=None) -> bool:
+        return True
+
+    async def send_audio_bytes(self, audio_bytes) -> bool:
+        if self._gate is not None:
+            await self._gate.wait()
+        self.frames.append(bytes(audio_bytes))
+        return True
+
+    async def close_session(self):
+        self.closed += 1
+
+
+def _pcm(value: int, size: int = FRAME) -> bytes:
+    return np.full(size // 2, value, dtype=np.int16).tobytes()
+
+
+def _columns(frame: bytes, channels: int) -> np.ndarray:
+    return np.frombuffer(frame, dtype=np.int16).reshape(-1, channels)
+
+
+async def _attach(service: FakeService, channels: int = 2):
+    mux = DeepgramMultiplexer("key", channels=channels)
+    mux._service = service
+    handles = [mux.get_channel(f"session-{i}") for i in range(channels)]
+    for handle in handles:
+        await handle.initialize()
+    return mux, handles
+
+
+async def _drain(mux: DeepgramMultiplexer):
+    if mux._sender_task is not None:
+        await mux._sender_task
+
+
+def test_idle_channel_is_padded_with_silence():
+    async def run():
+        service = FakeService()
+        mux, (a, _) = await _attach(service)
+        await a.send_audio_bytes(_pcm(7))
+        await _drain(mux)
+        assert len(service.frames) == 1
+        columns = _columns(service.frames[0], 2)
+        assert (columns[:, 0] == 7).all()
+        assert (columns[:, 1] == 0).all()
+
+    asyncio.run(run())
+
+
+def test_partial_buffer_is_held_until_full():
+    async def run():
+        service = FakeService()
+        mux, (a, b) = await _attach(service)
+        await b.send_audio_bytes(_pcm(3, FRAME // 2))
+        await a.send_audio_bytes(_pcm(7))
+        await _drain(mux)
+        # b is mid-frame, so nothing is padded and sent yet
+        assert service.frames == []
+
+        await b.send_audio_bytes(_pcm(3, FRAME // 2))
+        await _drain(mux)
+        assert len(service.frames) == 1
+        columns = _columns(service.frames[0], 2)
+        assert (columns[:, 0] == 7).all()
+        assert (columns[:, 1] == 3).all()
+
+    asyncio.run(run())
+
+
+def test_lagging_partial_is_flushed_after_max_lead():
+    async def run():
+        service = FakeService()
+        mux, (a, b) = await _attach(service)
+        await b.send_audio_bytes(_pcm(3, FRAME // 2))
+        for _ in range(DeepgramMultiplexer.MAX_LEAD_FRAMES):
+            await a.send_audio_bytes(_pcm(7))
+        await _drain(mux)
+        assert len(service.frames) >= 1
+        columns = _columns(service.frames[0], 2)
+        half = FRAME // 4
+        assert (columns[:half, 1] == 3).all()
+        assert (columns[half:, 1] == 0).all()
+
+    asyncio.run(run())
+
+
+def test_write_does_not_wait_for_a_stalled_send():
+    async def run():
+        gate = asyncio.Event()
+        service = FakeService(gate)
+        mux, (a, _) = await _attach(service)
+        await a.send_audio_bytes(_pcm(1))
+        # The sender is blocked; later writes still return immediately
+        await asyncio.wait_for(a.send_audio_bytes(_pcm(2)), timeout=0.5)
+        gate.set()
+        await _drain(mux)
+        assert [int(_columns(f, 2)[0, 0]) for f in service.frames] == [1, 2]
+
+    asyncio.run(run())
+
+
+def test_last_release_stops_sender_and_closes_once():
+    async def run():
+        service = FakeService(asyncio.Event())
+        mux, (a, b) = await _attach(service)
+        await a.send_audio_bytes(_pcm(1))
+        await a.send_audio_bytes(_pcm(2))
+        await a.close()
+        assert service.closed == 0
+        await b.close()
+        assert service.closed == 1
+        assert mux._sender_task is None
+        assert not mux._outbox
+        assert service.frames == []
+        assert mux.get_channel("session-new").channel_index == 0
+
+    asyncio.run(run())
+
+
+def test_instances_are_keyed_by_configuration():
+    DeepgramMultiplexer._instances.clear()
+    try:
+        first = DeepgramMultiplexer.get_instance("key-a", channels=4)
+        assert DeepgramMultiplexer.get_instance("key-a", channels=4) is first
+        assert DeepgramMultiplexer.get_instance("key-b", channels=4) is not first
+        assert DeepgramMultiplexer.get_instance("key-a", channels=8) is not first
+    finally:
+        DeepgramMultiplexer._instances.clear()
+
+
+def test_release_drops_the_channels_queued_transcripts():
+    async def run():
+        service = FakeService()
+        mux, (a, b) = await _attach(service)
+        service._enqueue_transcript({"text": "a", "is_final": True, "channel_index": 0})
+        service._enqueue_transcript({"text": "b", "is_final": True, "channel_index": 1})
+        await a.close()
+        assert service._transcript_queue.get_nowait()["text"] == "b"
+        assert service._transcript_queue.empty()
+
+    asyncio.run(run())
@@ -0,0 +1,53 @@
+"""DeepgramService transcript queue shedding and teardown.
+
+Run from backend/: python -m pytest tests
+"""
+import asyncio
+
+from app.services.deepgram_service import DeepgramService
+
+
+def _transcript(text: str, is_final: bool) -> dict:
+    return {"text": text, "is_final": is_final, "confidence": 1.0, "speaker": "Trainee"}
+
+
+def _drain(service: DeepgramService) -> list:
+    items = []
+    while not service._transcript_queue.empty():
+        items.append(service._transcript_queue.get_nowait())
+    return items
+
+
+def test_full_queue_sheds_interims_but_keeps_finals():
+    async def run():
+        service = DeepgramService("key")
+        service.TRANSCRIPT_QUEUE_SIZE = 4
+        service._enqueue_transcript(_transcript("one", True))
+        service._enqueue_transcript(_transcript("tw", False))
+        service._enqueue_transcript(_transcript("two", True))
+        service._enqueue_transcript(_transcript("thr", False))
+        service._enqueue_transcript(_transcript("three", True))
+        assert [t["text"] for t in _drain(service)] == ["one", "two", "three"]
+
+    asyncio.run(run())
+
+
+def test_queue_of_finals_is_never_trimmed():
+    async def run():
+        service = DeepgramService("key")
+        service.TRANSCRIPT_QUEUE_SIZE = 2
+        for i in range(4):
+            service._enqueue_transcript(_transcript(str(i), True))
+        assert [t["text"] for t in _drain(service)] == ["0", "1", "2", "3"]
+
+    asyncio.run(run())
+
+
+def test_close_session_discards_undelivered_transcripts():
+    async def run():
+        service = DeepgramService("key")
+        service._enqueue_transcript(_transcript("stale", True))
+        await service.close_session()
+        assert service._transcript_queue.empty()
+
+    asyncio.run(run())
@@ -602,7 +602,7 @@ export default function App() {
                     });
                 },
                 async (
-                    audioData: string,
+                    audioData: string | Uint8Array,
                     mimeType?: string,
                     sampleRate?: number,
                     channels?: number,
@@ -620,17 +620,18 @@ export default function App() {
 
                         let audioBuffer: AudioBuffer | null = null;
                         try {
+                            // Binary frames arrive as bytes; legacy JSON audio is base64
+                            const audioBytes = typeof audioData === 'string' ? decode(audioData) : audioData;
                             // Treat any 'mp3' or 'mpeg' mime types as MP3
                             if (mimeType && (mimeType.includes('mp3') || mimeType.includes('mpeg'))) {
                                 // MP3: decode using decodeAudioData
-                                const uint8 = decode(audioData);
                                 // Create an ArrayBuffer view containing only the audio bytes
-                                const arrayBuffer = uint8.buffer.slice(uint8.byteOffset, uint8.byteOffset + uint8.byteLength) as ArrayBuffer;
+                                const arrayBuffer = audioBytes.buffer.slice(audioBytes.byteOffset, audioBytes.byteOffset + audioBytes.byteLength) as ArrayBuffer;
                                 audioBuffer = await outputAudioContext.decodeAudioData(arrayBuffer);
                             } else {
                                 // Default to PCM Int16
                                 audioBuffer = await decodeAudioData(
-                                    decode(audioData),
+                                    audioBytes,
                                     outputAudioContext,
                                     sampleRate || 24000,
                                     channels || 1
@@ -693,11 +694,9 @@ export default function App() {
                     // Send audio data via WebSocket only if we're actively listening
                     if (wsServiceRef.current && captureAudioRef.current) {
                         console.debug('[App] Sending audio data to WebSocket');
-                        // Convert Int16Array to base64 string
-                        const int16Array = event.data;
-                        const uint8Array = new Uint8Array(int16Array.buffer, int16Array.byteOffset, int16Array.byteLength);
-                        const base64String = btoa(String.fromCharCode(...uint8Array));
-                        wsServiceRef.current.sendAudio(base64String, 'audio/pcm;rate=16000');
+                        // Send the Int16Array PCM samples as a binary frame
+                        const int16Array: Int16Array = event.data;
+                        wsServiceRef.current.sendAudio(int16Array);
                     } else {
                         console.debug('[App] Not sending audio: captureAudioRef.current =', captureAudioRef.current);
                     }
@@ -3,7 +3,7 @@ import { AgentStatus, TranscriptMessage } from './api';
 const WS_BASE_URL = import.meta.env.VITE_WS_BASE_URL || 'ws://localhost:8000/api/ws';
 
 export interface WebSocketMessage {
-  type: 'audio' | 'audio_stop' | 'transcript' | 'status' | 'error' | 'end_session' | 'session_initialized' | 'pong' | 'transcript_history' | 'conversation_reset';
+  type: 'audio' | 'audio_header' | 'audio_stop' | 'transcript' | 'status' | 'error' | 'end_session' | 'session_initialized' | 'pong' | 'transcript_history' | 'conversation_reset';
   data?: any;
 }
 
@@ -23,14 +23,16 @@ export class WebSocketService {
   private ws: WebSocket | null = null;
   private onStatusChange?: (status: AgentStatus) => void;
   private onTranscript?: (transcript: TranscriptMessage) => void;
-  private onAudio?: (audioData: string, mimeType?: string, sampleRate?: number, channels?: number, bitRate?: number, codec?: string, bitDepth?: number, encoding?: string, speaker?: string) => void;
+  private onAudio?: (audioData: string | Uint8Array, mimeType?: string, sampleRate?: number, channels?: number, bitRate?: number, codec?: string, bitDepth?: number, encoding?: string, speaker?: string) => void;
+  // Metadata for the next binary audio frame
+  private pendingAudioHeader: any = null;
   private onAudioStop?: (reason?: string) => void;
   private onError?: (error: string) => void;
 
   constructor(
     onStatusChange?: (status: AgentStatus) => void,
     onTranscript?: (transcript: TranscriptMessage) => void,
-    onAudio?: (audioData: string, mimeType?: string, sampleRate?: number, channels?: number, bitRate?: number, codec?: string, bitDepth?: number, encoding?: string, speaker?: string) => void,
+    onAudio?: (audioData: string | Uint8Array, mimeType?: string, sampleRate?: number, channels?: number, bitRate?: number, codec?: string, bitDepth?: number, encoding?: string, speaker?: string) => void,
     onAudioStop?: (reason?: string) => void,
     onError?: (error: string) => void
   ) {
@@ -46,6 +48,7 @@ export class WebSocketService {
       try {
         const query = productId ? `?product_id=${encodeURIComponent(productId)}` : '';
         this.ws = new WebSocket(`${WS_BASE_URL}/session/${personaId}${query}`);
+        this.ws.binaryType = 'arraybuffer';
 
         this.ws.onopen = () => {
           console.log('WebSocket connected');
@@ -53,6 +56,10 @@ export class WebSocketService {
         };
 
         this.ws.onmessage = (event) => {
+          if (event.data instanceof ArrayBuffer) {
+            this.handleBinaryAudio(event.data);
+            return;
+          }
           try {
             const message: WebSocketMessage = JSON.parse(event.data);
             this.handleMessage(message);
@@ -83,6 +90,28 @@ export class WebSocketService {
     });
   }
 
+  private handleBinaryAudio(buffer: ArrayBuffer) {
+    const header = this.pendingAudioHeader;
+    this.pendingAudioHeader = null;
+    if (!header) {
+      console.warn('Received binary audio without a header; dropping');
+      return;
+    }
+    if (this.onAudio) {
+      this.onAudio(
+        new Uint8Array(buffer),
+        header.mime_type,
+        header.sample_rate,
+        header.channels,
+        header.bit_rate,
+        header.codec,
+        header.bit_depth,
+        header.encoding,
+        header.speaker
+      );
+    }
+  }
+
   private handleMessage(message: WebSocketMessage) {
     switch (message.type) {
       case 'session_initialized':
@@ -118,6 +147,10 @@ export class WebSocketService {
         }
         break;
 
+      case 'audio_header':
+        this.pendingAudioHeader = message.data || null;
+        break;
+
       case 'audio_stop':
         if (this.onAudioStop) {
           this.onAudioStop(message.data?.reason);
@@ -150,16 +183,10 @@ export class WebSocketService {
     }
   }
 
-  sendAudio(audioData: string, mimeType: string = 'audio/pcm;rate=16000') {
+  sendAudio(audioData: ArrayBufferView) {
     if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-      const message: WebSocketMessage = {
-        type: 'audio',
-        data: {
-          audio: audioData,
-          mime_type: mimeType
-        }
-      };
-      this.ws.send(JSON.stringify(message));
+      // Raw 16-bit PCM @ 16kHz goes out as a binary frame (no base64 overhead)
+      this.ws.send(audioData);
     } else {
       console.error('WebSocket is not connected');
     }